@@ -51,6 +51,13 @@ import lxml
 import httpx
 from fake_useragent import UserAgent
 
+# Shared logger implementation (credential masking, debug-log.txt, background file writes).
+# Imported as utils.logger, like the rest of the package, so only one copy of the module is loaded.
+_SRC_DIR = str(pathlib.Path(__file__).resolve().parent.parent / "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+from utils.logger import StealthLogger as _SharedStealthLogger
+
 # Import new modular components
 try:
     from _1aOLD.experimental.network_guard import NetworkGuard, NetworkConfig
@@ -104,74 +111,12 @@ class SystemConfig:
     enable_security_reports: bool = True
     alert_on_detection: bool = True
 
-class StealthLogger:
+class StealthLogger(_SharedStealthLogger):
     """Advanced logging system with security-conscious output filtering"""
     
     def __init__(self, config: SystemConfig):
         self.config = config
-        self.logger = self._setup_logger()
-        
-    def _setup_logger(self) -> logging.Logger:
-        """Configure multi-handler logger with security filtering"""
-        logger = logging.getLogger("stealth-system")
-        logger.setLevel(logging.DEBUG)
-        
-        # Custom formatter with enhanced context
-        formatter = logging.Formatter(
-            "%(asctime)s | %(name)s | %(levelname)-8s | %(funcName)s:%(lineno)d | %(message)s"
-        )
-        
-        # File handler with rotation
-        file_handler = logging.FileHandler(
-            self.config.log_file, mode="a", encoding="utf-8"
-        )
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        
-        # Console handler with filtered output
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
-        
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
-        
-        return logger
-    
-    def debug(self, msg: str, *args, **kwargs):
-        """Security-filtered debug logging"""
-        filtered_msg = self._filter_sensitive(msg)
-        self.logger.debug(filtered_msg, *args, **kwargs)
-    
-    def info(self, msg: str, *args, **kwargs):
-        """Security-filtered info logging"""
-        filtered_msg = self._filter_sensitive(msg)
-        self.logger.info(filtered_msg, *args, **kwargs)
-    
-    def warning(self, msg: str, *args, **kwargs):
-        """Security-filtered warning logging"""
-        filtered_msg = self._filter_sensitive(msg)
-        self.logger.warning(filtered_msg, *args, **kwargs)
-    
-    def error(self, msg: str, *args, **kwargs):
-        """Security-filtered error logging"""
-        filtered_msg = self._filter_sensitive(msg)
-        self.logger.error(filtered_msg, *args, **kwargs)
-    
-    def _filter_sensitive(self, msg: str) -> str:
-        """Filter out potentially sensitive information from logs"""
-        # Redact common sensitive patterns
-        patterns = [
-            (r'password["\s]*[:=]["\s]*[^"\s]+', 'password="***"'),
-            (r'token["\s]*[:=]["\s]*[^"\s]+', 'token="***"'),
-            (r'key["\s]*[:=]["\s]*[^"\s]+', 'key="***"'),
-        ]
-        
-        filtered = msg
-        for pattern, replacement in patterns:
-            filtered = re.sub(pattern, replacement, filtered, flags=re.IGNORECASE)
-        
-        return filtered
+        super().__init__(log_file=config.log_file, level="INFO", name="stealth-system")
 
 class HumanBehaviorEngine:
     """Advanced human behavior emulation with adaptive patterns"""
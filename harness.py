@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Shared Test Harness for BrowserControL01
+=========================================
+
+Result type and concurrent runner used by test_core.py and test_e2e_smoke.py.
+"""
+
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Threads for running tests. They mostly wait on imports and file reads, so the pool isn't sized by CPU count.
+MAX_WORKERS = 6
+
+
+def preload_modules(module_names: Iterable[str]) -> bool:
+    """Import the project modules a test run uses before its tests run concurrently; False if any fails.
+
+    No module is then first imported by several threads at once (a failing import would leave
+    half-initialized modules behind for the others), so on False the tests must run one at a time.
+    """
+    ok = True
+    for module_name in module_names:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            ok = False
+    return ok
+
+
+def run_ordered(tests: Sequence[Tuple[str, Callable[[], Any]]], run: Callable[[str, Callable[[], Any]], Any],
+                workers: int = MAX_WORKERS) -> List[Any]:
+    """Call run(name, test_func) for every test, on up to `workers` threads; results in declaration order"""
+    if workers <= 1 or len(tests) <= 1:
+        return [run(name, test_func) for name, test_func in tests]
+    with ThreadPoolExecutor(max_workers=min(len(tests), workers)) as pool:
+        return list(pool.map(lambda test: run(*test), tests))
+
+
+class TestResult:
+    """Container for test results"""
+
+    __slots__ = ("name", "passed", "error", "details")  # No per-instance __dict__
+    __test__ = False  # Not a pytest test class
+
+    def __init__(self, name: str):
+        self.name = name
+        self.passed = False
+        self.error: Optional[BaseException] = None
+        self.details: Any = {}
+
+    def set_error(self, error: BaseException) -> None:
+        """Mark the test failed with `error`.
+
+        The exception (and its traceback) is kept until the run ends; the failed frames' local
+        variables are dropped so they don't stay alive with it. Tracebacks still format fully.
+        """
+        import traceback  # Only needed once something fails
+        self.passed = False
+        self.error = error
+        traceback.clear_frames(error.__traceback__)
+
+    @property
+    def status(self) -> str:
+        """PASS, FAIL (assertion) or ERROR (any other exception)"""
+        if self.passed:
+            return "PASS"
+        return "FAIL" if isinstance(self.error, AssertionError) else "ERROR"
+
+    @property
+    def traceback_str(self) -> Optional[str]:
+        """Formatted traceback of the failure (built on request; the exception keeps its traceback)"""
+        if self.error is None:
+            return None
+        import traceback
+        return "".join(traceback.format_exception(type(self.error), self.error, self.error.__traceback__))
+
+    def to_dict(self, include_traceback: bool = False) -> Dict[str, Any]:
+        details = self.details
+        if include_traceback and self.error is not None:
+            details = {**details, "traceback": self.traceback_str}
+        return {
+            "name": self.name,
+            "passed": self.passed,
+            "error": str(self.error) if self.error else None,
+            "details": details
+        }
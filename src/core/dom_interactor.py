@@ -789,12 +789,12 @@ class AdaptiveDOMInteractor:
                                 name=detail_name, value=extracted_value, extraction_type=extract_type_full,
                                 source_selector=individual_selector_str, properties=element_props, extraction_successful=True
                             )
-                            self.log.debug(f"Successfully extracted detail '{detail_name}' for item {item_idx+1} using selector '{individual_selector_str}' (attempt {s_idx+1}/{len(selectors_to_attempt_for_detail)}).")
+                            self.log.debug("Successfully extracted detail '%s' for item %d using selector '%s' (attempt %d/%d).", detail_name, item_idx + 1, individual_selector_str, s_idx + 1, len(selectors_to_attempt_for_detail))
                             detail_extracted_successfully_this_item = True
                             break # Successfully extracted this detail with one of the selectors, move to next detail_name
 
                         except NoSuchElementException:
-                            self.log.debug(f"Detail '{detail_name}' (selector: '{individual_selector_str}') not found in item {item_idx+1} (attempt {s_idx+1}/{len(selectors_to_attempt_for_detail)}).")
+                            self.log.debug("Detail '%s' (selector: '%s') not found in item %d (attempt %d/%d).", detail_name, individual_selector_str, item_idx + 1, s_idx + 1, len(selectors_to_attempt_for_detail))
                         except StaleElementReferenceException:
                             self.log.warning(f"StaleElementReferenceException for detail '{detail_name}' (selector: '{individual_selector_str}') in item {item_idx+1}. Item might be changing during extraction.")
                             # This attempt for this selector fails; loop for selectors continues or is handled by is_required logic below.
@@ -816,7 +816,7 @@ class AdaptiveDOMInteractor:
                         extracted_items_list_of_dicts.append(current_item_all_details)
                         title_ext_elem = current_item_all_details.get('title') 
                         log_title = title_ext_elem.value[:50] if title_ext_elem and title_ext_elem.extraction_successful and isinstance(title_ext_elem.value, str) else "[No Title]"
-                        self.log.debug(f"Successfully processed and added item {item_idx+1}: {log_title}...")
+                        self.log.debug("Successfully processed and added item %d: %s...", item_idx + 1, log_title)
                     else:
                         title_ext_elem = current_item_all_details.get('title') 
                         log_title = title_ext_elem.value[:50] if title_ext_elem and title_ext_elem.extraction_successful and isinstance(title_ext_elem.value, str) else "[No Title]"
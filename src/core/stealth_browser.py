@@ -152,6 +152,11 @@ class StealthBrowserManager:
         finally:
             self.cleanup()
     
+    @property
+    def is_closed(self) -> bool:
+        """True when there is no live driver session to shut down"""
+        return self.driver is None
+
     def cleanup(self) -> None:
         """Clean up browser session"""
         if self.driver:
@@ -54,4 +54,9 @@ class ExtractedElement:
     def __post_init__(self):
         # Ensure notes is always a list
         if self.notes is None:
-            self.notes = [] 
\ No newline at end of file
+            self.notes = []
+        # Serialization label for a WebElement value as (element, label). Built here from the tag name
+        # already captured in `properties`, so encoding the element never queries the browser again.
+        props = self.properties
+        if props is not None and props.tag_name and props.raw_webelement is not None and props.raw_webelement is self.value:
+            self._value_repr = (self.value, f"<WebElement: {props.tag_name} id={self.value.id[:8]}...>") 
\ No newline at end of file
@@ -19,7 +19,7 @@ from core import SystemConfig
 from core.config import SiteConfig
 from sites import site_registry, GoogleSearchModule, AmazonSearchModule, EbaySearchModule, ChatGPTModule, GenericSiteModule, WikipediaSiteModule
 from utils.logger import get_logger
-from utils.serialization import CustomJsonEncoder
+from utils.serialization import dumps as json_dumps, dump_to_file as dump_json_to_file
 from utils.file_utils import ensure_directory_exists, is_valid_chrome_profile_dir # Added new import
 
 # Using undetected_chromedriver for anti-detection
@@ -272,6 +272,9 @@ class BrowserControlSystem:
                 'success': False,
                 'error': str(e)
             }
+        finally:
+            # Release module-held resources (e.g. persistent HTTP clients); the WebDriver stays managed here
+            site_module_instance.cleanup_resources()
     
     def import_external_session(self, source_profile_path_str: str, target_bot_profile_name: str, overwrite: bool = False) -> Dict[str, Any]:
         """Imports a Chrome session from an external profile path to a bot profile."""
@@ -515,8 +518,7 @@ def main():
             output_file = Path(args.output_file)
             try:
                 output_file.parent.mkdir(parents=True, exist_ok=True)
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(result, f, indent=4, cls=CustomJsonEncoder)
+                dump_json_to_file(output_file, result)
                 print(f"✅ Generic interaction results saved to: {output_file.resolve()}")
             except Exception as e:
                 print(f"❌ Error saving generic interaction results: {e}")
@@ -545,7 +547,7 @@ def main():
 
             results = system.execute_site_workflow(args.site_name, args.operation, **final_operation_params)
             # Output for site command
-            print(json.dumps(results, indent=4, cls=CustomJsonEncoder))
+            print(json_dumps(results, pretty=True).decode('utf-8'))
             # Optional: Save to file based on args if 'site' command has output args
         
         elif args.command == 'import-session':
@@ -569,7 +571,7 @@ def main():
                 max_pages_to_explore=args.max_pages,
                 keywords_to_follow=args.follow_keywords
             )
-            print(json.dumps(result, indent=4, cls=CustomJsonEncoder))
+            print(json_dumps(result, pretty=True).decode('utf-8'))
             if result and result.get("success"):
                  data = result.get('data', {})
                  output_path = data.get('output_path', 'N/A')
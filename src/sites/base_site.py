@@ -33,8 +33,8 @@ class BaseSiteModule(BaseWorkflow):
     }
 
     def __init__(self, driver: uc.Chrome, config: SystemConfig, logger: StealthLogger, site_config: SiteConfig, **kwargs):
-        # Don't initialize components in BaseWorkflow since we handle them here
-        super().__init__(config=config, logger=logger, init_components=False, **kwargs)
+        # Components are assigned below, so BaseWorkflow's lazy defaults are never built
+        super().__init__(config=config, logger=logger, **kwargs)
         self.driver = driver
         self.site_config = site_config
         self._site_selectors_data: Dict[str, Dict[str, str]] = self._load_site_selectors()
@@ -6,6 +6,7 @@ Google Search Module for BrowserControL01
 Optimized automation for Google Search with advanced result extraction.
 """
 
+import json
 import time
 from typing import Dict, Any, List, Optional
 from selenium.webdriver.common.keys import Keys
@@ -18,6 +19,47 @@ from core.structures import ExtractedElement # Changed
 import undetected_chromedriver as uc # For driver type hint
 from utils.logger import StealthLogger
 
+# Function of timeoutMs resolving with the number of elements matching the selector as soon as one
+# is attached to the DOM, or with 0 once the timeout elapses. Formatted with the json-encoded selector.
+_RESULT_ITEMS_OBSERVER_JS = """(timeoutMs => new Promise(resolve => {
+    const selector = %s;
+    const count = () => document.querySelectorAll(selector).length;
+    if (count() > 0) { resolve(count()); return; }
+    const observer = new MutationObserver(() => {
+        const n = count();
+        if (n > 0) { observer.disconnect(); resolve(n); }
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+    setTimeout(() => { observer.disconnect(); resolve(count()); }, timeoutMs);
+}))"""
+
+# Function of timeoutMs resolving with the name of the first [name, selector] pair (in priority
+# order) that matches an element, or with null once the timeout elapses. Formatted with the
+# json-encoded list of pairs.
+_FIRST_MATCH_OBSERVER_JS = """(timeoutMs => new Promise(resolve => {
+    const candidates = %s;
+    const match = () => {
+        for (const [name, selector] of candidates) {
+            if (document.querySelector(selector)) return name;
+        }
+        return null;
+    };
+    if (match()) { resolve(match()); return; }
+    const observer = new MutationObserver(() => {
+        const name = match();
+        if (name) { observer.disconnect(); resolve(name); }
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+    setTimeout(() => { observer.disconnect(); resolve(match()); }, timeoutMs);
+}))"""
+
+
+def _css_selector_group(selector_or_list) -> Optional[str]:
+    """Join the CSS selectors of a JSON selector entry into one selector group, dropping XPath ones."""
+    selectors = selector_or_list if isinstance(selector_or_list, list) else [selector_or_list]
+    css_selectors = [sel for sel in selectors if isinstance(sel, str) and sel and not sel.startswith("xpath:")]
+    return ", ".join(css_selectors) if css_selectors else None
+
 
 class GoogleSearchModule(BaseSiteModule):
     """Google Search specialized automation module, inheriting from BaseSiteModule"""
@@ -26,6 +68,24 @@ class GoogleSearchModule(BaseSiteModule):
         # SiteConfig is now passed in.
         super().__init__(driver=driver, config=config, logger=logger, site_config=site_config, **kwargs)
         self.driver = driver # Store managed driver
+
+        # Selectors are fixed for the module's lifetime, so resolve them and build the JS used
+        # on every search once here instead of per query.
+        self._result_item_selector = self.get_selector('results_page', 'result_item_selector')
+        self._item_detail_config = self._build_item_detail_config()
+        self._js_await_result_items: Optional[str] = None
+        item_selector = _css_selector_group(self._result_item_selector)
+        if item_selector:
+            self._js_await_result_items = _RESULT_ITEMS_OBSERVER_JS % json.dumps(item_selector)
+
+        # Races the consent dialog against the search input; the dialog is listed first so it
+        # wins when both are present.
+        self._js_await_landing_state: Optional[str] = None
+        consent_selector = _css_selector_group(self.get_selector('consent_page', 'dialog_identifier_selector'))
+        input_selector = _css_selector_group(self.get_selector('search_page', 'search_input_selectors'))
+        if consent_selector and input_selector:
+            self._js_await_landing_state = _FIRST_MATCH_OBSERVER_JS % json.dumps(
+                [['consent', consent_selector], ['search_input', input_selector]])
         self.log.info(f"GoogleSearchModule initialized with managed WebDriver. Site config name: {self.site_config.name}")
 
     def search(self, query: str, **params) -> Dict[str, Any]:
@@ -49,7 +109,13 @@ class GoogleSearchModule(BaseSiteModule):
             current_url_for_error = self.driver.current_url
             self.wait_for_page_ready(self.driver) 
             
-            self._handle_consent_popup(self.driver)
+            # Consent handling waits and probes for the dialog; skip it when the search input
+            # shows up without a dialog (the common case for already-consented profiles).
+            landing_state = self._await_landing_state(self.driver)
+            if landing_state == 'search_input':
+                self.log.debug("Search input ready without a consent dialog. Skipping consent handling.")
+            else:
+                self._handle_consent_popup(self.driver)
             current_url_for_error = self.driver.current_url
             
             if not self._perform_search_action(self.driver, query):
@@ -211,66 +277,74 @@ class GoogleSearchModule(BaseSiteModule):
         return True
     
     def _wait_for_search_results_page(self, driver) -> bool:
-        """Wait for Google search results to load using selectors from JSON"""
+        """Wait for Google search results to load using selectors from JSON.
+
+        Result items are awaited with an in-page MutationObserver evaluated over CDP, so the
+        call returns as soon as the first item is attached instead of polling for it.
+        Falls back to polling the results container if CDP evaluation is unavailable.
+        """
         self.log.debug("Waiting for Google search results page to load...")
-        results_container_selector = self.get_selector("results_page", "results_container_selector")
-        if not results_container_selector:
-            self.log.error("Results container selector not defined in config. Cannot wait for results.")
-            return False
-        
-        # Wait for results container using wait_for_site_element
-        # wait_for_site_element internally uses self.get_selector, so we pass keys
-        # wait_for_site_element now returns ExtractedElement
-        container_ext = self.wait_for_site_element(driver, 
-                                                        group_key='results_page', 
-                                                        element_key='results_container_selector', 
-                                                        timeout=self.site_config.timeouts.get('search_results_container_wait', 10))
-        
-        if not (container_ext and container_ext.value):
-            self.log.warning("Google search results container did not appear in time.")
-            # Check for "No results" message as a possible valid outcome
-            no_results_msg_selector_key = "no_results_message_selector" # Define key for clarity
-            # Check if this key exists in JSON first using get_selector to avoid errors if not defined.
-            if self.get_selector("results_page", no_results_msg_selector_key):
-                 no_results_ext = self.find_site_element(driver, 
-                                                          group_key="results_page", 
-                                                          element_key=no_results_msg_selector_key, 
-                                                          retries=0, 
-                                                          log_not_found=False)
-                 if no_results_ext and no_results_ext.value:
-                      self.log.info("Search results page loaded, but indicates no results based on 'no_results_message_selector'.")
-                      return True # Page is loaded, even if no results.
+        if not self._result_item_selector:
+            self.log.error("Result item selector not defined in config. Cannot wait for results.")
             return False
 
-        # Additional pause for results to populate within the container
-        time.sleep(self.site_config.timeouts.get('search_results_populate_wait', 1.0))
-        self.log.info("Google search results page appears to be loaded.")
-        return True
-    
-    def _extract_google_results(self, driver, max_results: int, extract_snippets: bool) -> List[Dict[str, Any]]:
-        """Extract Google search results using extract_item_details_from_list"""
-        self.log.debug(f"Extracting up to {max_results} Google results. Snippets: {extract_snippets}")
-
-        results_container_selector = self.get_selector('results_page', 'results_container_selector')
-        result_item_selector = self.get_selector('results_page', 'result_item_selector')
-
-        if not results_container_selector or not result_item_selector:
-            self.log.error("Missing essential selectors for Google results extraction (container or item).")
-            return []
-
-        # The container for extract_item_details_from_list is where items are direct children.
-        # For Google, result_item_selector usually finds items *within* results_container_selector.
-        # So, the effective item selector to pass to extract_item_details_from_list should target
-        # the individual result items directly.
-        # We assume result_item_selector is relative to the driver or document root.
-        # If result_item_selector is meant to be *inside* results_container_selector, 
-        # then we should provide results_container_selector + " " + result_item_selector, or similar logic.
-        # For now, assuming result_item_selector is globally sufficient for find_elements.
-        
-        # Let's adjust: extract_item_details_from_list expects a container *from which to find items*.
-        # For Google, the `div.g` are the items themselves, typically found within `#search`.
-        # The `container_selector` for `extract_item_details_from_list` should be the `result_item_selector`.
-        
+        wait_timeout = self.site_config.timeouts.get('search_results_container_wait', 10)
+        items_found = self._await_result_items(driver, wait_timeout)
+
+        if items_found is None: # CDP evaluation not possible, use the polling wait on the container
+            container_ext = self.wait_for_site_element(driver,
+                                                       group_key='results_page',
+                                                       element_key='results_container_selector',
+                                                       timeout=wait_timeout)
+            if container_ext and container_ext.value:
+                # Additional pause for results to populate within the container
+                time.sleep(self.site_config.timeouts.get('search_results_populate_wait', 1.0))
+                self.log.info("Google search results page appears to be loaded.")
+                return True
+        elif items_found > 0:
+            self.log.info("Google search results page appears to be loaded (%d result items).", items_found)
+            return True
+
+        self.log.warning("Google search results did not appear in time.")
+        # Check for "No results" message as a possible valid outcome
+        no_results_msg_selector_key = "no_results_message_selector" # Define key for clarity
+        # Check if this key exists in JSON first using get_selector to avoid errors if not defined.
+        if self.get_selector("results_page", no_results_msg_selector_key):
+             no_results_ext = self.find_site_element(driver, 
+                                                      group_key="results_page", 
+                                                      element_key=no_results_msg_selector_key, 
+                                                      retries=0, 
+                                                      log_not_found=False)
+             if no_results_ext and no_results_ext.value:
+                  self.log.info("Search results page loaded, but indicates no results based on 'no_results_message_selector'.")
+                  return True # Page is loaded, even if no results.
+        return False
+
+    def _await_result_items(self, driver, timeout: float) -> Optional[int]:
+        """Block in a single CDP call until result items exist in the DOM.
+
+        Returns the number of matching items (0 on timeout), or None if the driver
+        cannot evaluate the promise via CDP.
+        """
+        if not self._js_await_result_items:
+            return None
+        found, value = self._evaluate_js_promise(driver, f"{self._js_await_result_items}({int(timeout * 1000)})")
+        return int(value or 0) if found else None
+
+    def _await_landing_state(self, driver) -> Optional[str]:
+        """Wait until either the consent dialog or the search input is present.
+
+        Returns 'consent' or 'search_input' for whichever appears first, or None on timeout
+        or if CDP evaluation is unavailable.
+        """
+        if not self._js_await_landing_state:
+            return None
+        timeout = self.site_config.timeouts.get('landing_state_wait', 5)
+        _, value = self._evaluate_js_promise(driver, f"{self._js_await_landing_state}({int(timeout * 1000)})")
+        return value
+
+    def _build_item_detail_config(self) -> Dict[str, Dict[str, Any]]:
+        """Resolve the per-result detail selectors passed to extract_item_details_from_list."""
         item_detail_config = {
             'title': {
                 'selector': self.get_selector('results_page', 'item_title_selector'),
@@ -283,27 +357,45 @@ class GoogleSearchModule(BaseSiteModule):
                 'is_required': True
             }
         }
-        if extract_snippets:
-            # item_snippet_selectors can be a list. We need to handle this.
-            # extract_item_details_from_list expects a single selector string for each detail.
-            # We will need to pick one or adapt extract_item_details_from_list later.
-            # For now, let's assume the first snippet selector is primary.
-            snippet_selectors_val = self.get_selector('results_page', 'item_snippet_selectors')
-            primary_snippet_selector = None
-            if isinstance(snippet_selectors_val, list) and snippet_selectors_val:
-                primary_snippet_selector = snippet_selectors_val[0]
-            elif isinstance(snippet_selectors_val, str):
-                primary_snippet_selector = snippet_selectors_val
-            
-            if primary_snippet_selector:
-                 item_detail_config['snippet'] = {
-                    'selector': primary_snippet_selector,
-                    'type': 'text',
-                    'is_required': False
-                }
-            else:
-                self.log.warning("No snippet selector found or configured for Google results.")
+        # item_snippet_selectors can be a list. We need to handle this.
+        # extract_item_details_from_list expects a single selector string for each detail.
+        # We will need to pick one or adapt extract_item_details_from_list later.
+        # For now, let's assume the first snippet selector is primary.
+        snippet_selectors_val = self.get_selector('results_page', 'item_snippet_selectors')
+        primary_snippet_selector = None
+        if isinstance(snippet_selectors_val, list) and snippet_selectors_val:
+            primary_snippet_selector = snippet_selectors_val[0]
+        elif isinstance(snippet_selectors_val, str):
+            primary_snippet_selector = snippet_selectors_val
+        
+        if primary_snippet_selector:
+             item_detail_config['snippet'] = {
+                'selector': primary_snippet_selector,
+                'type': 'text',
+                'is_required': False
+            }
+        # A missing snippet selector is reported by _extract_google_results, and only when snippets are requested
+        return item_detail_config
 
+    def _extract_google_results(self, driver, max_results: int, extract_snippets: bool) -> List[Dict[str, Any]]:
+        """Extract Google search results using extract_item_details_from_list"""
+        self.log.debug("Extracting up to %s Google results. Snippets: %s", max_results, extract_snippets)
+
+        result_item_selector = self._result_item_selector
+
+        if not result_item_selector:
+            self.log.error("Missing result item selector for Google results extraction.")
+            return []
+
+        # extract_item_details_from_list expects a container *from which to find items*.
+        # For Google, the `div.g` are the items themselves, typically found within `#search`.
+        # The `container_selector` for `extract_item_details_from_list` should be the `result_item_selector`.
+        item_detail_config = self._item_detail_config
+        if not extract_snippets:
+            if 'snippet' in item_detail_config:
+                item_detail_config = {name: detail for name, detail in item_detail_config.items() if name != 'snippet'}
+        elif 'snippet' not in item_detail_config:
+            self.log.warning("No snippet selector found or configured for Google results.")
 
         # The `container_selector` for extract_item_details_from_list should point to the *individual items*.
         # `result_item_selector` from our JSON ("div.g") is this.
@@ -324,7 +416,7 @@ class GoogleSearchModule(BaseSiteModule):
             url = url_ext.value if url_ext and url_ext.extraction_successful else None
 
             if not (title and url):
-                self.log.debug(f"Skipping Google result item {idx+1} due to missing title or URL.")
+                self.log.debug("Skipping Google result item %d due to missing title or URL.", idx + 1)
                 continue
 
             single_result = {
@@ -340,11 +432,11 @@ class GoogleSearchModule(BaseSiteModule):
                 if snippet_ext and snippet_ext.extraction_successful:
                     single_result['snippet'] = snippet_ext.value
                 elif 'snippet' in item_detail_config: # If we tried to extract it but failed
-                     self.log.debug(f"Snippet extraction failed for item {idx+1}: {title}")
+                     self.log.debug("Snippet extraction failed for item %d: %s", idx + 1, title)
 
 
             processed_results.append(single_result)
-            self.log.debug(f"Processed Google result: {title[:60]}...")
+            self.log.debug("Processed Google result: %.60s...", title)
             
         self.log.info(f"Extracted {len(processed_results)} Google search results items.")
         return processed_results
@@ -4,13 +4,37 @@ fetching page content, and downloading images.
 It is structured as a Site Module for BrowserControL01.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import hashlib
+import html
+import json
+import time
 import httpx
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+try:
+    import orjson # Optional: much faster JSON encoding for per-page output and the page cache
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+try:
+    # Optional C HTML5 parser (gumbo-based); builds the same lxml tree, faster and spec-compliant on malformed markup
+    from html5_parser import parse as _html5_parse
+    HTML5_PARSER_AVAILABLE = True
+except (ImportError, RuntimeError): # RuntimeError: built against a different libxml2 than the installed lxml wheel
+    HTML5_PARSER_AVAILABLE = False
 import re
-from urllib.parse import urljoin, urlparse
+import secrets
+import struct
+import uuid
+from urllib.parse import quote, unquote, urljoin, urlparse
 import os
-from PIL import Image
+from PIL import Image, UnidentifiedImageError
 import io
+import itertools
+import tempfile
 from pathlib import Path
 import datetime # Added import for datetime
 
@@ -23,7 +47,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementNotInteractableException
 
-from typing import Optional, Any, Dict, List, Tuple
+from typing import Optional, Any, Dict, List, Set, Tuple, Union
 
 # Project-specific imports
 from .base_site import BaseSiteModule, site_registry
@@ -32,6 +56,208 @@ from utils.logger import StealthLogger # For logger type hint
 import undetected_chromedriver as uc # For driver type hint
 from utils.file_utils import ensure_directory_exists # For creating output dirs
 
+def _has_class_xpath(class_name: str) -> str:
+    """XPath predicate matching elements whose class list contains `class_name`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+# Compiled once at import; evaluated by libxml2 rather than walking Python-level tag objects.
+_CONTENT_TEXT_XP = etree.XPath("//*[@id='mw-content-text']")
+_PARSER_OUTPUT_XP = etree.XPath(f".//div[{_has_class_xpath('mw-parser-output')}]")
+_TOC_XP = etree.XPath("//*[@id='toc']")
+# Direct children only (the BeautifulSoup version used recursive=False)
+_CONTENT_BLOCKS_XP = etree.XPath("*[self::p or self::h2 or self::h3 or self::h4 or self::h5 or self::h6 "
+                                 "or self::ul or self::ol or self::dl]")
+# Headline spans of the content container's direct-child headings, fetched in a single call
+_CHILD_HEADING_HEADLINES_XP = etree.XPath("./*[self::h2 or self::h3 or self::h4 or self::h5 or self::h6]"
+                                          f"//*[{_has_class_xpath('mw-headline')}]")
+_TOC_LINKS_XP = etree.XPath(".//a[starts-with(@href, '#')]")
+_TOC_TEXT_SPAN_XP = etree.XPath(f".//span[{_has_class_xpath('toctext')}]")
+_LIST_ITEMS_XP = etree.XPath("li")
+_LINKS_XP = etree.XPath(".//a[@href]")
+# Same strings BeautifulSoup.get_text() yields: skips comments, <script> and <style> contents
+_TEXT_NODES_XP = etree.XPath(".//text()[not(ancestor::script) and not(ancestor::style)]", smart_strings=False)
+_IMAGES_XP = etree.XPath("//img")
+_FIGURES_XP = etree.XPath("//figure")
+_DESCENDANT_IMAGES_XP = etree.XPath(".//img")
+_FILE_DESCRIPTION_LINK_XP = etree.XPath(f".//a[{_has_class_xpath('mw-file-description')}]")
+_FILE_MEDIA_DIV_XP = etree.XPath("//div[@id='file']")
+_FULL_IMAGE_LINK_DIV_XP = etree.XPath(f"//div[{_has_class_xpath('fullImageLink')}]")
+_ANCHORS_XP = etree.XPath(".//a")
+
+_SECTION_BLOCK_TAGS = frozenset(('p', 'ul', 'ol', 'dl'))
+# Folder-name sanitizer, compiled once instead of per page
+_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_\-]')
+
+
+class _SafeFilenameTable(dict):
+    """str.translate() table keeping [A-Za-z0-9_.-] and mapping every other code point to '_'.
+
+    Unsafe code points are filled in on first use, so the table never has to cover all of Unicode.
+    """
+
+    def __missing__(self, codepoint: int) -> int:
+        self[codepoint] = _UNDERSCORE
+        return _UNDERSCORE
+
+
+_UNDERSCORE = ord('_')
+# Image-filename sanitizer: one C-level pass per name instead of a regex substitution
+_FILENAME_SAFE_TABLE = _SafeFilenameTable(
+    (ord(c), ord(c)) for c in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_.-"
+)
+
+# Characters MediaWiki leaves unescaped in /wiki/ links, so API-derived URLs match extracted hrefs
+_WIKI_TITLE_SAFE_CHARS = ";@$!*(),/~:"
+# Relative href forms that always point inside the wiki
+_INTERNAL_LINK_PREFIXES = ('/wiki/', './', '#')
+# Non-article namespaces excluded from extracted links (str.startswith accepts the whole tuple)
+_FORBIDDEN_WIKI_PREFIXES = ('/wiki/Special:', '/wiki/File:', '/wiki/Category:', '/wiki/Help:',
+                            '/wiki/Template:', '/wiki/Portal:', '/wiki/Wikipedia:')
+
+
+def _node_text(element: Any, separator: str = '') -> str:
+    """Equivalent of BeautifulSoup's get_text(separator=..., strip=True) for an lxml element."""
+    return separator.join(text for text in (t.strip() for t in _TEXT_NODES_XP(element)) if text)
+
+
+def _parse_html(markup: Any) -> etree._Element:
+    """Parse page markup (str or bytes) into an lxml tree, preferring html5-parser when installed."""
+    if HTML5_PARSER_AVAILABLE:
+        return _html5_parse(markup)
+    return lxml.html.fromstring(markup)
+
+
+def _api_page_target(query_or_url: str) -> Optional[Tuple[str, str]]:
+    """(host, title) to request from the MediaWiki API, or None if the input is not an article URL or search term."""
+    parsed = urlparse(query_or_url)
+    if parsed.scheme in ('http', 'https'):
+        if parsed.netloc.endswith('wikipedia.org') and parsed.path.startswith('/wiki/') and not parsed.query \
+                and not parsed.path.startswith(_FORBIDDEN_WIKI_PREFIXES):
+            title = unquote(parsed.path[len('/wiki/'):])
+            return (parsed.netloc, title) if title else None
+        return None
+    # Plain search term: try it as an exact title on English Wikipedia, like _navigate_wikipedia_search
+    return ('en.wikipedia.org', query_or_url) if query_or_url.strip() else None
+
+
+def _json_bytes(data: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON (non-ASCII kept as-is), via orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _collapsed_text(element: Any) -> str:
+    """Element text with whitespace runs collapsed to single spaces.
+
+    Unlike text_content(), text nodes are joined with a space (so '<li>a<ul><li>b</li></ul></li>'
+    gives 'a b', not 'ab') and script/style contents are skipped. The join/split run in C.
+    """
+    return ' '.join(' '.join(_TEXT_NODES_XP(element)).split())
+
+
+def _first(nodes: List[Any]) -> Optional[Any]:
+    return nodes[0] if nodes else None
+
+
+def _header_image_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """Read (width, height) straight from a PNG or GIF header, or None for other formats.
+
+    These two store their dimensions at fixed offsets, so the common cases skip Pillow
+    and the worker-pool hop entirely.
+    """
+    if data[:8] == b'\x89PNG\r\n\x1a\n' and data[12:16] == b'IHDR' and len(data) >= 24:
+        return struct.unpack('>II', data[16:24])
+    if data[:6] in (b'GIF87a', b'GIF89a') and len(data) >= 10:
+        return struct.unpack('<HH', data[6:10])
+    return None
+
+
+def _image_size(source: Union[bytes, str]) -> Tuple[int, int]:
+    """Read (width, height) from image bytes or a file path; Pillow does not decode pixel data for this."""
+    with Image.open(io.BytesIO(source) if isinstance(source, bytes) else source) as img:
+        return img.size
+
+
+def _widest_srcset_candidate(srcset: Optional[str], display_width: Optional[int]) -> Optional[Tuple[str, int]]:
+    """Return (url, pixel width) of the widest `srcset` entry, or None if no width can be derived.
+
+    Handles both 'Nw' width descriptors and the 'Nx' density descriptors MediaWiki emits
+    (the latter need the rendered `width` attribute to convert into pixels).
+    """
+    if not srcset:
+        return None
+    widest: Optional[Tuple[str, int]] = None
+    for candidate in srcset.split(','):
+        parts = candidate.split()
+        if not parts:
+            continue
+        descriptor = parts[1] if len(parts) > 1 else '1x'
+        try:
+            if descriptor.endswith('w'):
+                width = int(descriptor[:-1])
+            elif descriptor.endswith('x') and display_width:
+                width = int(float(descriptor[:-1]) * display_width)
+            else:
+                continue
+        except ValueError:
+            continue
+        if widest is None or width > widest[1]:
+            widest = (parts[0], width)
+    return widest
+
+
+def _create_unique_file(path: str) -> Tuple[int, str]:
+    """Atomically create `path`, or a sibling with a short random suffix if it is taken.
+
+    Returns (fd, created path). O_EXCL makes the existence check and the creation one
+    syscall, so there is no stat-per-collision loop and no window for another writer.
+    """
+    name, ext = os.path.splitext(path)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    candidate = path
+    for _ in range(_UNIQUE_FILENAME_ATTEMPTS):
+        try:
+            return os.open(candidate, flags, 0o644), candidate
+        except FileExistsError:
+            candidate = f"{name}_{secrets.token_hex(3)}{ext}"
+    candidate = f"{name}_{uuid.uuid4().hex}{ext}" # Practically collision-free fallback
+    return os.open(candidate, flags, 0o644), candidate
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write `data` to the raw descriptor `fd` and close it.
+
+    The payload is already one contiguous buffer, so it goes straight to the kernel
+    instead of being copied through a BufferedWriter first.
+    """
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):] # os.write may accept fewer bytes than offered
+    finally:
+        os.close(fd)
+
+# Upper bound on image downloads (file-page lookup + image fetch) in flight at once per page
+_MAX_CONCURRENT_IMAGE_DOWNLOADS = 8
+# Leading bytes fetched to read image dimensions; JPEG/PNG/GIF/WebP headers fit well within this
+_IMAGE_PROBE_BYTES = 65536
+_IMAGE_STREAM_CHUNK_BYTES = 65536
+_IMAGE_WORKER_THREADS = min(4, os.cpu_count() or 1)
+# File extension for images whose URL has none, keyed by (lowercased) media type
+_CONTENT_TYPE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+}
+# The plain filename plus up to three random-suffix retries before falling back to a uuid4 suffix
+_UNIQUE_FILENAME_ATTEMPTS = 4
+# Pages cached on disk (HTML + parsed sections) are reused for this long instead of re-navigating
+_PAGE_CACHE_DIR_NAME = ".cache"
+_PAGE_CACHE_MAX_AGE_SECONDS = 24 * 3600
+
 # Helper: Selenium-based navigation and interaction (can be moved to utils later if generic enough)
 # These were previously global, now can be static or instance methods if needed by the module.
 # For now, let's make them static or integrate their logic directly.
@@ -67,6 +293,17 @@ class WikipediaSiteModule(BaseSiteModule):
     def __init__(self, driver: uc.Chrome, config: SystemConfig, logger: StealthLogger, site_config: SiteConfig, **kwargs):
         super().__init__(driver=driver, config=config, logger=logger, site_config=site_config, **kwargs)
         self.driver = driver
+        # File: page URL -> resolved original media URL (None if the page had no usable link), shared across pages of a run
+        self._file_page_cache: Dict[str, Optional[str]] = {}
+        # Suffix for per-page output folders; next() on itertools.count is atomic, so no lock is needed
+        self._page_counter = itertools.count(1)
+        # Persistent HTTP/2 client, reused across pages so TCP/TLS connections stay warm. An AsyncClient
+        # is bound to the loop it first ran on, so the module keeps its own loop for all async work.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self._page_cache_pruned = False # Expired page cache entries are removed once, on the first cache lookup
+        # Worker threads for Pillow/file work so it does not stall the event loop's concurrent downloads
+        self._image_pool: Optional[ThreadPoolExecutor] = None
         # self.config is SystemConfig from super
         # self.log is StealthLogger from super
         # self.site_config is SiteConfig from super
@@ -112,109 +349,167 @@ class WikipediaSiteModule(BaseSiteModule):
                  exploration_depth: int = 0, # New parameter
                  max_pages_to_explore: int = 1, # New parameter
                  keywords_to_follow: Optional[List[str]] = None, # New parameter
-                 _visited_urls: Optional[set] = None, # Internal for recursion
+                 _visited_urls: Optional[set] = None, # Internal: URLs already processed in this run
                  _current_pages_count: Optional[int] = 0, # DEPRECATED, will use len(_visited_urls)
                  _base_run_output_dir: Optional[Path] = None # New internal param for root output path of the run
                  ) -> Dict[str, Any]:
         """
         Main interaction method for Wikipedia.
-        Searches Wikipedia, extracts text, downloads images, and can recursively explore links.
+        Searches Wikipedia, extracts text, downloads images, and can explore links breadth-first.
         Manages its own output directory under a main 'wikipedia_runs' directory.
         """
-        
         if _visited_urls is None:
             _visited_urls = set() # Initialize for the first call
+        if _base_run_output_dir is None: # This is the initial call in an exploration chain
+            _base_run_output_dir = self._resolve_run_output_dir(query_or_url, output_subfolder_name)
+
+        return self._explore(query_or_url, extract_text, download_images_wider_than, exploration_depth,
+                             max_pages_to_explore, keywords_to_follow, _visited_urls, _base_run_output_dir)
+
+    def _explore(self, root_query_or_url: str, extract_text: bool, download_images_wider_than: Optional[int],
+                 exploration_depth: int, max_pages_to_explore: int, keywords_to_follow: Optional[List[str]],
+                 visited_urls: set, base_run_output_dir: Path) -> Dict[str, Any]:
+        """Process the root page, then followed links level by level from an explicit queue.
+
+        Each page's result lists the pages reached from it under 'explored_pages', so the returned
+        structure is the same tree the recursive implementation produced.
+        """
+        root_result: Optional[Dict[str, Any]] = None
+        processed_results: List[Dict[str, Any]] = []
+        # (url, depth remaining, explored_pages list of the linking page or None for the root)
+        frontier: deque = deque([(root_query_or_url, exploration_depth, None)])
 
-        # Check if URL is already processed or currently being processed higher in the call stack
-        if query_or_url in _visited_urls:
-             self.log.info(f"URL {query_or_url} already visited or in current processing chain. Skipping.")
-             return self._create_success_result(data={'url': query_or_url, 'status': 'skipped_already_visited_or_processing'}, message="URL already visited/processing.")
+        while frontier:
+            query_or_url, depth, parent_explored_pages = frontier.popleft()
 
-        # Check against max_pages_to_explore using the size of the shared _visited_urls set
-        if len(_visited_urls) >= max_pages_to_explore:
-            self.log.info(f"Max pages to explore ({max_pages_to_explore}) reached based on visited set size ({len(_visited_urls)}). Skipping {query_or_url}.")
-            return self._create_success_result(data={'url': query_or_url, 'status': 'skipped_max_pages_global'}, message="Max pages limit reached for the run.")
+            # Check if URL is already processed (reached through another page)
+            if query_or_url in visited_urls:
+                self.log.info(f"URL {query_or_url} already visited or in current processing chain. Skipping.")
+                page_result = self._create_success_result(data={'url': query_or_url, 'status': 'skipped_already_visited_or_processing'}, message="URL already visited/processing.")
+            # Check against max_pages_to_explore using the size of the shared visited set
+            elif len(visited_urls) >= max_pages_to_explore:
+                if parent_explored_pages is not None:
+                    self.log.info(f"Max pages ({max_pages_to_explore}) reached before exploring {query_or_url}. Stopping exploration.")
+                    break
+                self.log.info(f"Max pages to explore ({max_pages_to_explore}) reached based on visited set size ({len(visited_urls)}). Skipping {query_or_url}.")
+                page_result = self._create_success_result(data={'url': query_or_url, 'status': 'skipped_max_pages_global'}, message="Max pages limit reached for the run.")
+            else:
+                page_result, child_urls = self._process_one_page(
+                    query_or_url, extract_text, download_images_wider_than, depth,
+                    max_pages_to_explore, keywords_to_follow, visited_urls, base_run_output_dir)
+                page_data = page_result.get('data') if page_result.get('success') else None
+                if page_data and 'explored_pages' in page_data:
+                    processed_results.append(page_data)
+                    for i, child_url in enumerate(child_urls):
+                        self.log.debug(f"Queued link {i+1}/{len(child_urls)} from {page_data['url']}: {child_url} (Depth remaining: {depth-1})")
+                        frontier.append((child_url, depth - 1, page_data['explored_pages']))
 
-        _visited_urls.add(query_or_url) # Add current URL to mark it as being processed in this call
-        current_processing_count = len(_visited_urls) # This is now the Nth page being processed in the run
+            if parent_explored_pages is None:
+                root_result = page_result
+            else:
+                parent_explored_pages.append(page_result)
+
+        for page_data in processed_results:
+            summary = page_data['exploration_summary']
+            summary['pages_explored_from_this_page'] = len(page_data['explored_pages'])
+            summary['total_unique_urls_processed_in_run'] = len(visited_urls)
+        return root_result
+
+    def _resolve_run_output_dir(self, query_or_url: str, output_subfolder_name: Optional[str]) -> Path:
+        """Output directory for a whole run: the user-given subfolder, or one named after the query and start time."""
+        wiki_runs_dir = self._wikipedia_runs_dir()
+        if output_subfolder_name: # User specified a name for the run
+            return wiki_runs_dir / output_subfolder_name
+        # Generate a unique name for the run based on initial query and timestamp
+        initial_query_base = _SANITIZE_RE.sub('_', query_or_url.split('/')[-1] if '/' in query_or_url else query_or_url)
+        initial_query_timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        return wiki_runs_dir / f"{initial_query_base}_{initial_query_timestamp}"
+
+    def _process_one_page(self, query_or_url: str, extract_text: bool, download_images_wider_than: Optional[int],
+                          exploration_depth: int, max_pages_to_explore: int, keywords_to_follow: Optional[List[str]],
+                          visited_urls: set, base_run_output_dir: Path) -> Tuple[Dict[str, Any], List[str]]:
+        """Fetch, parse and save a single page. Returns (result, unvisited links to follow from it)."""
+        visited_urls.add(query_or_url) # Add current URL to mark it as being processed
+        current_processing_count = len(visited_urls) # This is now the Nth page being processed in the run
 
         self.log.info(f"Wikipedia 'get_data' started. Query/URL: '{query_or_url}', Depth: {exploration_depth}, Processing page #{current_processing_count}/{max_pages_to_explore}")
 
-        if not self.driver or not self.is_driver_active_from_module():
-            return self._create_error_result(error_message="Browser driver is not active or available")
+        # A fresh on-disk copy of the page skips Selenium navigation (and, usually, parsing) entirely
+        cached_page = self._load_cached_page(query_or_url) if urlparse(query_or_url).scheme in ('http', 'https') else None
+        cached_parsed_content: Optional[Dict[str, Dict[str, Any]]] = None
+        if cached_page:
+            html_content, page_title, cached_parsed_content = cached_page
+            page_url = query_or_url
+            self.log.info(f"Using cached copy of {page_url}")
+        else:
+            # Plain HTTP via the MediaWiki API first; the browser is only needed when that fails
+            # (non-article URLs, search terms that are not exact titles, blocked requests).
+            api_page = self._fetch_via_api(query_or_url)
+            if api_page:
+                html_content, page_url, page_title = api_page
+            else:
+                if not self.driver or not self.is_driver_active_from_module():
+                    return self._create_error_result(error_message="Browser driver is not active or available"), []
 
-        if not _navigate_wikipedia_search(self.driver, query_or_url, self.log):
-            return self._create_error_result(error_message=f"Failed to navigate to Wikipedia for: {query_or_url}", current_url=self.driver.current_url if self.driver else None)
-        
-        self.wait_for_page_ready(self.driver)
-        
-        page_url = self.driver.current_url # Actual URL after navigation/redirects
-        # If the navigated URL is different from query_or_url (e.g., search term resolved to a page), add it to visited.
-        if page_url != query_or_url and page_url in _visited_urls:
-            self.log.info(f"Redirected to an already visited URL: {page_url}. Skipping.")
-            return self._create_success_result(data={'url': page_url, 'status': 'skipped_visited_redirect'}, message="Redirected to URL already visited.")
-        _visited_urls.add(page_url)
+                if not _navigate_wikipedia_search(self.driver, query_or_url, self.log):
+                    return self._create_error_result(error_message=f"Failed to navigate to Wikipedia for: {query_or_url}", current_url=self.driver.current_url if self.driver else None), []
+                
+                self.wait_for_page_ready(self.driver)
+                
+                page_url = self.driver.current_url # Actual URL after navigation/redirects
+                page_title = self.driver.title
+                html_content = self.driver.page_source
 
+            # If the resolved URL is different from query_or_url (e.g., search term resolved to a page), add it to visited.
+            if page_url != query_or_url and page_url in visited_urls:
+                self.log.info(f"Redirected to an already visited URL: {page_url}. Skipping.")
+                return self._create_success_result(data={'url': page_url, 'status': 'skipped_visited_redirect'}, message="Redirected to URL already visited."), []
+            visited_urls.add(page_url)
+        sanitized_page_title_for_folder = _SANITIZE_RE.sub('_', page_title)[:100] if page_title else "untitled_page"
 
-        html_content = self.driver.page_source
-        page_title = self.driver.title
-        sanitized_page_title_for_folder = re.sub(r'[^a-zA-Z0-9_\\-]', '_', page_title)[:100] if page_title else "untitled_page"
+        wants_images = download_images_wider_than is not None and download_images_wider_than > 0
+        # Parse the page once; text extraction and image discovery share the same lxml tree.
+        needs_parse = extract_text and cached_parsed_content is None
+        page_root = _parse_html(html_content) if html_content and (needs_parse or wants_images) else None
 
         parsed_data_content: Optional[Dict[str, Dict[str, Any]]] = None
-        if extract_text:
+        if needs_parse:
             self.log.info(f"Parsing text content and links from {page_url}...")
-            parsed_data_content = self._parse_page_content(html_content, base_url=page_url)
+            parsed_data_content = self._parse_page_content(page_root, base_url=page_url)
+        elif extract_text:
+            parsed_data_content = cached_parsed_content
+
+        if not cached_page and html_content:
+            self._store_cached_page(page_url, html_content, page_title, parsed_data_content)
 
         image_paths = []
         output_path_str: Optional[str] = None
         # unique_run_id_for_page = "" # No longer needed in this form
 
-        # Determine the base output directory for the entire run (initial call)
-        # and the specific output directory for the current page.
+        # The specific output directory for the current page, inside the run's base output dir
         current_page_specific_output_dir: Optional[Path] = None
 
-        if _base_run_output_dir is None: # This is the initial call in an exploration chain
-            if hasattr(self.config, 'output_dir') and self.config.output_dir:
-                main_output_dir_root = Path(self.config.output_dir)
-            else:
-                main_output_dir_root = self.config.base_path / "output"
-            
-            wiki_runs_dir = main_output_dir_root / "wikipedia_runs"
-
-            if output_subfolder_name: # User specified a name for the run
-                base_run_output_dir_for_this_run = wiki_runs_dir / output_subfolder_name
-            else: # Generate a unique name for the run based on initial query and timestamp
-                initial_query_base = re.sub(r'[^a-zA-Z0-9_\\-]', '_', query_or_url.split('/')[-1] if '/' in query_or_url else query_or_url)
-                initial_query_timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S_%f')
-                base_run_output_dir_for_this_run = wiki_runs_dir / f"{initial_query_base}_{initial_query_timestamp}"
-            
-            _resolved_base_run_output_dir = base_run_output_dir_for_this_run
-        else: # This is a recursive call, use the passed-in base directory
-            _resolved_base_run_output_dir = _base_run_output_dir
-
         # Now, create the specific folder for *this* page's content, inside the base run output dir
-        if download_images_wider_than is not None and download_images_wider_than > 0 or parsed_data_content:
+        if wants_images or parsed_data_content:
             # Use sanitized page title for the subfolder name to make it human-readable
-            # Add a unique suffix in case of title collisions (though unlikely for different Wikipedia pages)
-            page_folder_name = f"{sanitized_page_title_for_folder}_{datetime.datetime.now().strftime('%H%M%S_%f')}"
-            current_page_specific_output_dir = _resolved_base_run_output_dir / page_folder_name
+            # Add a unique, increasing suffix in case of title collisions (though unlikely for different Wikipedia pages)
+            page_folder_name = f"{sanitized_page_title_for_folder}_{next(self._page_counter):06d}"
+            current_page_specific_output_dir = base_run_output_dir / page_folder_name
             
             ensure_directory_exists(current_page_specific_output_dir)
             output_path_str = str(current_page_specific_output_dir)
 
-            if download_images_wider_than is not None and download_images_wider_than > 0:
+            if wants_images:
                 image_download_folder = current_page_specific_output_dir / "images"
                 ensure_directory_exists(image_download_folder)
                 self.log.info(f"Downloading images > {download_images_wider_than}px from {page_url} to {image_download_folder}")
-                image_paths = self._download_images(html_content, page_url, str(image_download_folder), download_images_wider_than, self.log)
+                image_paths = self._download_images(page_root, page_url, str(image_download_folder), download_images_wider_than, self.log)
                 self.log.info(f"Downloaded {len(image_paths)} images meeting criteria.")
 
             if parsed_data_content:
                 text_content_file = current_page_specific_output_dir / "text_content.json"
                 try:
-                    with open(text_content_file, 'w', encoding='utf-8') as f:
-                        import json
-                        json.dump(parsed_data_content, f, ensure_ascii=False, indent=4)
+                    text_content_file.write_bytes(_json_bytes(parsed_data_content))
                     self.log.info(f"Text content and links saved to {text_content_file}")
                 except Exception as e_json:
                     self.log.error(f"Failed to save text content to {text_content_file}: {e_json}")
@@ -224,10 +519,9 @@ class WikipediaSiteModule(BaseSiteModule):
         elif extract_text:
             self.log.warning(f"Text extraction enabled, but no structured content was parsed from {page_url}.")
 
-        explored_pages_data = []
-        if exploration_depth > 0 and parsed_data_content and len(_visited_urls) < max_pages_to_explore:
+        links_to_explore_on_this_page: List[str] = []
+        if exploration_depth > 0 and parsed_data_content and len(visited_urls) < max_pages_to_explore:
             self.log.info(f"Starting exploration from {page_url} (depth {exploration_depth}, keywords: {keywords_to_follow})")
-            links_to_explore_on_this_page = [] # Use a temporary list for current page's candidates
             if keywords_to_follow:
                 normalized_keywords = [kw.lower() for kw in keywords_to_follow]
                 for section_title, section_content in parsed_data_content.items():
@@ -235,118 +529,198 @@ class WikipediaSiteModule(BaseSiteModule):
                         link_text_lower = link_info.get('text', '').lower()
                         if any(kw in link_text_lower for kw in normalized_keywords):
                             link_href = link_info.get('href')
-                            # Crucial check: only consider if not ALREADY in the global _visited_urls
+                            # Crucial check: only consider if not ALREADY in the global visited_urls
                             # and is a valid Wikipedia link, and not already queued from THIS page.
-                            if link_href and link_href not in _visited_urls and urlparse(link_href).netloc.endswith('wikipedia.org') and link_href not in links_to_explore_on_this_page:
+                            if link_href and link_href not in visited_urls and urlparse(link_href).netloc.endswith('wikipedia.org') and link_href not in links_to_explore_on_this_page:
                                 links_to_explore_on_this_page.append(link_href)
             
             self.log.debug(f"Found {len(links_to_explore_on_this_page)} unique, unvisited links on this page matching keywords for further exploration.")
 
-            for i, link_to_visit in enumerate(links_to_explore_on_this_page):
-                # Max pages check again before diving deeper, using the up-to-date len(_visited_urls)
-                if len(_visited_urls) >= max_pages_to_explore:
-                    self.log.info(f"Max pages ({max_pages_to_explore}) reached before exploring {link_to_visit}. Stopping further exploration from this page.")
-                    break
-                
-                self.log.info(f"Exploring link {i+1}/{len(links_to_explore_on_this_page)}: {link_to_visit} (Depth remaining: {exploration_depth-1})")
-                sub_page_data = self.get_data(
-                    query_or_url=link_to_visit,
-                    extract_text=extract_text,
-                    download_images_wider_than=download_images_wider_than,
-                    output_subfolder_name=None, # Not used by recursive calls for their own base, _base_run_output_dir is used
-                    exploration_depth=exploration_depth - 1,
-                    max_pages_to_explore=max_pages_to_explore,
-                    keywords_to_follow=keywords_to_follow,
-                    _visited_urls=_visited_urls, 
-                    _current_pages_count=None, # Deprecated
-                    _base_run_output_dir=_resolved_base_run_output_dir # Pass down the root output dir for the run
-                )
-                explored_pages_data.append(sub_page_data)
-                # No need to manually update count here, len(_visited_urls) is the source of truth.
-
         return self._create_success_result(data={
             'url': page_url,
             'title': page_title,
             'parsed_content': parsed_data_content,
             'downloaded_images': image_paths,
             'output_path': output_path_str,
-            'explored_pages': explored_pages_data,
+            'explored_pages': [], # Filled by _explore as linked pages are processed
             'exploration_summary': {
-                'current_page_url': page_url, # Added for clarity in recursive calls
+                'current_page_url': page_url, # Added for clarity in nested results
                 'exploration_depth_for_this_page': exploration_depth,
-                'pages_explored_from_this_page': len(explored_pages_data),
-                'total_unique_urls_processed_in_run': len(_visited_urls)
+                'pages_explored_from_this_page': 0,
+                'total_unique_urls_processed_in_run': len(visited_urls)
             }
-        })
+        }), links_to_explore_on_this_page
+
+    def _fetch_via_api(self, query_or_url: str) -> Optional[Tuple[str, str, str]]:
+        """Fetch an article through the MediaWiki action=parse API. Returns (html, page url, page title) or None.
+
+        The API returns the same parser output as the rendered page, wrapped here in a
+        'mw-content-text' div so _parse_page_content and _download_images handle it unchanged.
+        """
+        target = _api_page_target(query_or_url)
+        if not target:
+            return None
+        host, title = target
+        try:
+            payload = self._run_async(self._get_http_client().get(f"https://{host}/w/api.php", params={
+                'action': 'parse', 'page': title, 'prop': 'text', 'redirects': 1,
+                'disableeditsection': 1, 'format': 'json', 'formatversion': 2,
+            }))
+            payload.raise_for_status()
+            parsed = payload.json().get('parse') or {}
+        except (httpx.HTTPError, ValueError) as e:
+            self.log.debug(f"MediaWiki API fetch failed for '{title}' on {host}: {e}")
+            return None
+        if not parsed.get('text') or not parsed.get('title'):
+            self.log.debug(f"MediaWiki API returned no page for '{title}' on {host}; falling back to the browser.")
+            return None
+
+        resolved_title = parsed['title']
+        page_url = f"https://{host}/wiki/{quote(resolved_title.replace(' ', '_'), safe=_WIKI_TITLE_SAFE_CHARS)}"
+        page_title = f"{resolved_title} - Wikipedia" # Same form as the browser tab title
+        html_content = (f"<html><head><title>{html.escape(page_title)}</title></head>"
+                        f"<body><div id=\"mw-content-text\">{parsed['text']}</div></body></html>")
+        self.log.info(f"Fetched {page_url} via the MediaWiki API.")
+        return html_content, page_url, page_title
+
+    def _wikipedia_runs_dir(self) -> Path:
+        """Root directory holding all Wikipedia run folders (and the shared page cache)."""
+        if hasattr(self.config, 'output_dir') and self.config.output_dir:
+            main_output_dir_root = Path(self.config.output_dir)
+        else:
+            main_output_dir_root = self.config.base_path / "output"
+        return main_output_dir_root / "wikipedia_runs"
 
-    def _parse_page_content(self, html_content: str, base_url: str) -> Dict[str, Dict[str, Any]]:
-        if not html_content:
+    def _page_cache_paths(self, url: str) -> Tuple[Path, Path]:
+        """(html path, json path) for a page, keyed by its URL without fragment."""
+        canonical_url = urlparse(url)._replace(fragment='').geturl()
+        key = hashlib.sha1(canonical_url.encode('utf-8')).hexdigest()
+        cache_dir = self._wikipedia_runs_dir() / _PAGE_CACHE_DIR_NAME
+        return cache_dir / f"{key}.html", cache_dir / f"{key}.json"
+
+    def _load_cached_page(self, url: str) -> Optional[Tuple[str, str, Optional[Dict[str, Dict[str, Any]]]]]:
+        """Return (html, title, parsed sections or None) for a cached page younger than _PAGE_CACHE_MAX_AGE_SECONDS.
+
+        Expired entries are deleted (all of them on the first lookup, see _prune_page_cache), so the
+        cache directory does not grow across runs.
+        """
+        if not self._page_cache_pruned:
+            self._page_cache_pruned = True
+            self._prune_page_cache()
+        html_path, json_path = self._page_cache_paths(url)
+        try:
+            if time.time() - json_path.stat().st_mtime > _PAGE_CACHE_MAX_AGE_SECONDS:
+                # json first: without it the entry counts as a miss even if the html can't be removed
+                json_path.unlink(missing_ok=True)
+                html_path.unlink(missing_ok=True)
+                return None
+            meta = orjson.loads(json_path.read_bytes()) if ORJSON_AVAILABLE else json.loads(json_path.read_bytes())
+            html_content = html_path.read_text(encoding='utf-8')
+        except (OSError, ValueError):
+            return None # Missing, unreadable or corrupt entry: treat as a cache miss
+        return html_content, meta.get('title', ''), meta.get('parsed_content')
+
+    def _prune_page_cache(self) -> None:
+        """Delete cache files older than _PAGE_CACHE_MAX_AGE_SECONDS, including pages never requested again."""
+        cutoff = time.time() - _PAGE_CACHE_MAX_AGE_SECONDS
+        try:
+            with os.scandir(self._wikipedia_runs_dir() / _PAGE_CACHE_DIR_NAME) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+        except OSError as e: # No cache yet, or a file vanished/locked mid-scan; whatever is left is retried next run
+            if not isinstance(e, FileNotFoundError):
+                self.log.debug(f"Could not prune the page cache: {e}")
+
+    def _store_cached_page(self, url: str, html_content: str, title: str, parsed_content: Optional[Dict[str, Dict[str, Any]]]) -> None:
+        html_path, json_path = self._page_cache_paths(url)
+        try:
+            ensure_directory_exists(html_path.parent)
+            html_path.write_text(html_content, encoding='utf-8')
+            # Written last: its mtime marks the entry as complete and fresh
+            json_path.write_bytes(_json_bytes({'url': url, 'title': title, 'parsed_content': parsed_content}))
+        except OSError as e:
+            self.log.warning(f"Could not write page cache for {url}: {e}")
+
+    def _parse_page_content(self, root: Optional[etree._Element], base_url: str) -> Dict[str, Dict[str, Any]]:
+        if root is None:
             return {}
 
-        soup = BeautifulSoup(html_content, 'lxml')
-        main_content_container = soup.find(id='mw-content-text')
-        if not main_content_container:
+        main_content_container = _first(_CONTENT_TEXT_XP(root))
+        if main_content_container is None:
             self.log.warning("Could not find 'mw-content-text' div in Wikipedia page for parsing.")
             return {}
 
         # Try to find the more specific mw-parser-output div
-        parser_output_div = main_content_container.find('div', class_='mw-parser-output')
-        content_div_to_scan = parser_output_div if parser_output_div else main_content_container
-        if parser_output_div:
+        parser_output_div = _first(_PARSER_OUTPUT_XP(main_content_container))
+        content_div_to_scan = parser_output_div if parser_output_div is not None else main_content_container
+        if parser_output_div is not None:
             self.log.debug("Found 'mw-parser-output' div, using it as the primary content container.")
         else:
             self.log.debug("'mw-parser-output' not found, using 'mw-content-text' as content container.")
 
-        toc = soup.find(id='toc') # TOC is usually outside mw-parser-output, so find from main soup
+        toc = _first(_TOC_XP(root)) # TOC is usually outside mw-parser-output, so search the whole tree
+        toc_headlines: List[str] = []
+        if toc is not None:
+            for link_tag in _TOC_LINKS_XP(toc):
+                toc_text_span = _first(_TOC_TEXT_SPAN_XP(link_tag))
+                if toc_text_span is not None:
+                    toc_headlines.append(_node_text(toc_text_span))
+        toc_headline_set = set(toc_headlines)
+
         sections: Dict[str, Dict[str, Any]] = {}
         current_section_title = "Introduction" 
         current_section_elements: List[Any] = [] # Store elements (p, lists, etc.) to process for text and links
 
-        for element in content_div_to_scan.find_all(['p', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'dl'], recursive=False):
-            if element.name.startswith('h'):
-                headline_span = element.find(class_='mw-headline')
-                if headline_span:
-                    if current_section_elements:
-                        text_parts, links = self._extract_text_and_links_from_elements(current_section_elements, base_url)
-                        sections[current_section_title] = {'text': '\n'.join(text_parts).strip(), 'links': links}
-                    current_section_elements = []
-                    current_section_title = headline_span.get_text(strip=True)
-            elif element.name in ['p', 'ul', 'ol', 'dl']:
+        # Heading element -> headline text, built once for all headings (first headline span per heading)
+        headline_by_heading: Dict[Any, str] = {}
+        for headline_span in _CHILD_HEADING_HEADLINES_XP(content_div_to_scan):
+            heading = next(a for a in headline_span.iterancestors() if a.getparent() is content_div_to_scan)
+            if heading not in headline_by_heading:
+                headline_by_heading[heading] = _node_text(headline_span)
+
+        # TOC-driven grouping is collected in the same pass: each TOC headline owns the content
+        # blocks that follow its (first) heading up to the next heading that is also in the TOC.
+        toc_section_elements: Dict[str, List[Any]] = {}
+        current_toc_elements: Optional[List[Any]] = None
+
+        for element in _CONTENT_BLOCKS_XP(content_div_to_scan):
+            if element.tag in _SECTION_BLOCK_TAGS:
                 current_section_elements.append(element)
+                if current_toc_elements is not None:
+                    current_toc_elements.append(element)
+                continue
+
+            headline_text = headline_by_heading.get(element)
+            if headline_text is None:
+                continue
+            if current_section_elements:
+                text_parts, links = self._extract_text_and_links_from_elements(current_section_elements, base_url)
+                sections[current_section_title] = {'text': '\n'.join(text_parts).strip(), 'links': links}
+            current_section_elements = []
+            current_section_title = headline_text
+            if headline_text in toc_headline_set:
+                # A repeated headline ends the previous TOC section without reopening its own
+                if headline_text in toc_section_elements:
+                    current_toc_elements = None
+                else:
+                    current_toc_elements = toc_section_elements[headline_text] = []
 
         if current_section_elements: # Add the last collected section
             text_parts, links = self._extract_text_and_links_from_elements(current_section_elements, base_url)
             sections[current_section_title] = {'text': '\n'.join(text_parts).strip(), 'links': links}
 
-        if toc:
+        if toc is not None:
             self.log.debug("TOC found, refining sections based on TOC structure.")
             structured_sections: Dict[str, Dict[str, Any]] = {}
-            toc_links = toc.find_all('a', href=re.compile("^#"))
-            
-            toc_headlines = []
-            for link_tag in toc_links:
-                toc_text_span = link_tag.find('span', class_='toctext')
-                if toc_text_span:
-                    toc_headlines.append(toc_text_span.get_text(strip=True))
 
             intro_data = sections.get("Introduction")
             if intro_data and intro_data.get('text'): # Preserve intro content
                 structured_sections["Introduction"] = intro_data
             
             for toc_title in toc_headlines:
-                heading_element = content_div_to_scan.find(lambda tag: tag.name.startswith('h') and \
-                                                   tag.find(class_='mw-headline') and \
-                                                   tag.find(class_='mw-headline').get_text(strip=True) == toc_title)
-                if heading_element:
-                    section_elements_for_toc_item: List[Any] = []
-                    for sibling in heading_element.find_next_siblings():
-                        if sibling.name.startswith('h'):
-                            sibling_headline_span = sibling.find(class_='mw-headline')
-                            if sibling_headline_span and sibling_headline_span.get_text(strip=True) in toc_headlines:
-                                break 
-                        if sibling.name in ['p', 'ul', 'ol', 'dl']: # Collect relevant content elements
-                            section_elements_for_toc_item.append(sibling)
-                    
+                if toc_title in toc_section_elements:
+                    section_elements_for_toc_item = toc_section_elements[toc_title]
                     if section_elements_for_toc_item:
                         text_parts, links = self._extract_text_and_links_from_elements(section_elements_for_toc_item, base_url)
                         section_text_content = '\n'.join(text_parts).strip()
@@ -368,54 +742,71 @@ class WikipediaSiteModule(BaseSiteModule):
         return sections
 
     def _extract_text_and_links_from_elements(self, elements: List[Any], base_url: str) -> Tuple[List[str], List[Dict[str, str]]]:
-        """Helper to extract text and internal Wikipedia links from a list of BeautifulSoup elements."""
+        """Helper to extract text and internal Wikipedia links from a list of lxml elements."""
         text_parts: List[str] = []
         links: List[Dict[str, str]] = []
+        seen_hrefs: Set[str] = set() # Mirrors links' hrefs for O(1) duplicate checks
+        parsed_base_url = urlparse(base_url) # Parsed once, not per anchor
+        base_netloc = parsed_base_url.netloc
+        base_origin = f"{parsed_base_url.scheme}://{base_netloc}"
         
         for element in elements:
             # Get text from the element itself, handling lists appropriately
-            if element.name in ['ul', 'ol', 'dl']:
+            if element.tag in ('ul', 'ol', 'dl'):
                 list_items_texts = []
-                for li in element.find_all('li', recursive=False): # direct children list items
-                    list_items_texts.append(f"  - {li.get_text(separator=' ', strip=True)}")
+                for li in _LIST_ITEMS_XP(element): # direct children list items
+                    list_items_texts.append(f"  - {_collapsed_text(li)}")
                 text_parts.append('\n'.join(list_items_texts))
             else: # Typically 'p'
-                text_parts.append(element.get_text(separator=' ', strip=True))
+                text_parts.append(_collapsed_text(element))
 
             # Find all links within this element
-            for link_tag in element.find_all('a', href=True):
-                href = link_tag['href']
+            for link_tag in _LINKS_XP(element):
+                href = link_tag.get('href')
                 # Filter for internal Wikipedia links (relative, or full /wiki/ or /w/index.php links)
-                if href.startswith('/wiki/') or href.startswith('./') or href.startswith('#') or \
+                if href.startswith(_INTERNAL_LINK_PREFIXES) or \
                    (href.startswith('/') and not href.startswith('//') and 'index.php' in href) or \
-                   (urlparse(href).netloc == urlparse(base_url).netloc and ('/wiki/' in href or 'index.php' in href)):
+                   (urlparse(href).netloc == base_netloc and ('/wiki/' in href or 'index.php' in href)):
                     
-                    link_text = link_tag.get_text(strip=True)
-                    full_href = urljoin(base_url, href) # Ensure full URL
+                    link_text = _node_text(link_tag) # Same as get_text(strip=True): "[1]", not "[ 1 ]"
+                    if href.startswith('/') and not href.startswith('//') and '/.' not in href:
+                        # Site-relative link (the common case): same result as urljoin + urlparse(...).path
+                        # without re-parsing base_url and the joined URL for every anchor
+                        full_href = base_origin + href
+                        href_path = href.partition('#')[0].partition('?')[0]
+                    else:
+                        full_href = urljoin(base_url, href) # Ensure full URL
+                        href_path = urlparse(full_href).path
 
                     # Avoid duplicates and very short/non-descriptive link texts
-                    if link_text and len(link_text) > 1 and not any(l['href'] == full_href for l in links):
-                        parsed_href = urlparse(full_href)
+                    if link_text and len(link_text) > 1 and full_href not in seen_hrefs:
                         # Further filter out non-article links like Special pages, File pages, etc. if desired
-                        if not (parsed_href.path.startswith('/wiki/Special:') or \
-                                parsed_href.path.startswith('/wiki/File:') or \
-                                parsed_href.path.startswith('/wiki/Category:') or \
-                                parsed_href.path.startswith('/wiki/Help:') or \
-                                parsed_href.path.startswith('/wiki/Template:') or \
-                                parsed_href.path.startswith('/wiki/Portal:') or \
-                                parsed_href.path.startswith('/wiki/Wikipedia:')):
+                        if not href_path.startswith(_FORBIDDEN_WIKI_PREFIXES):
+                             seen_hrefs.add(full_href)
                              links.append({'text': link_text, 'href': full_href})
         return text_parts, links
 
-    def _download_images(self, html_content: str, base_url: str, download_folder: str, min_width: int, logger: StealthLogger) -> List[str]:
-        downloaded_image_paths = []
-        if not html_content:
-            return downloaded_image_paths
+    def _download_images(self, root: Optional[etree._Element], base_url: str, download_folder: str, min_width: int, logger: StealthLogger) -> List[str]:
+        """Download page images at least `min_width` px wide into `download_folder`.
+
+        Candidate images are collected in one pass over the page, then fetched concurrently
+        (bounded by _MAX_CONCURRENT_IMAGE_DOWNLOADS) over the module's persistent HTTP/2 client.
+        """
+        if root is None:
+            return []
 
-        soup = BeautifulSoup(html_content, 'lxml')
         # ensure_directory_exists is called by the caller `get_data`
 
-        for img_tag in soup.find_all('img'):
+        # Map each <img> to its nearest enclosing <figure> in one top-down pass, rather than walking
+        # up the ancestors of every image. Figures come in document order, so nested ones win.
+        # (lxml hands back the same proxy object for a node while it is referenced, so elements work as keys.)
+        figure_by_img: Dict[Any, Any] = {}
+        for figure in _FIGURES_XP(root):
+            for figure_img in _DESCENDANT_IMAGES_XP(figure):
+                figure_by_img[figure_img] = figure
+
+        candidates: List[Tuple[str, Optional[str]]] = [] # (img_url, file_page_url)
+        for img_tag in _IMAGES_XP(root):
             img_url = img_tag.get('src')
             if not img_url:
                 continue
@@ -423,117 +814,260 @@ class WikipediaSiteModule(BaseSiteModule):
             img_url = urljoin(base_url, img_url) # Resolve relative URLs
 
             if img_url.startswith('data:') or img_url.endswith('.svg'): # Skip data URIs and SVGs
-                logger.debug(f"Skipping decorative/SVG image: {img_url[:70]}...")
+                logger.debug("Skipping decorative/SVG image: %.70s...", img_url)
                 continue
             
             if img_url.startswith('//'): # Protocol relative URLs
                 parsed_base_url = urlparse(base_url)
                 img_url = f"{parsed_base_url.scheme}:{img_url}"
 
+            # Initial check for width attribute (often a thumbnail)
+            attr_width = img_tag.get('width')
+            attr_width_px = int(attr_width) if attr_width and attr_width.isdigit() else None
+            if attr_width_px is not None and attr_width_px < min_width:
+                logger.debug("Skipping image based on width attribute < %d: %s", min_width, img_url)
+                continue
+
+            # If the thumbnail (or its widest srcset variant) is already wide enough, download it
+            # directly and skip the File: page round-trip for the original.
+            srcset_candidate = _widest_srcset_candidate(img_tag.get('srcset'), attr_width_px)
+            if srcset_candidate and srcset_candidate[1] >= min_width:
+                candidates.append((urljoin(base_url, srcset_candidate[0]), None))
+                continue
+            if attr_width_px is not None: # Known to be >= min_width at this point
+                candidates.append((img_url, None))
+                continue
+
+            # Try to get the original image URL if it's a thumbnail (common in <figure>)
+            file_page_url = None
+            parent_figure = figure_by_img.get(img_tag)
+            if parent_figure is not None:
+                link_to_file_page = _first(_FILE_DESCRIPTION_LINK_XP(parent_figure))
+                if link_to_file_page is not None and link_to_file_page.get('href'):
+                    file_page_url = urljoin(base_url, link_to_file_page.get('href'))
+            candidates.append((img_url, file_page_url))
+
+        if not candidates:
+            return []
+        results = self._run_async(self._download_images_async(candidates, base_url, download_folder, min_width, logger))
+        return [path for path in results if path]
+
+    def _run_async(self, coro: Any) -> Any:
+        """Run `coro` to completion on the module's event loop (created on first use)."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client; must be called from within `_run_async`."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                follow_redirects=True,
+                timeout=20.0,
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+                headers={'User-Agent': 'browserControL01 / wiki-module'},
+            )
+        return self._http
+
+    async def _image_size_off_loop(self, source: Union[bytes, str]) -> Tuple[int, int]:
+        """Run _image_size on the module's bounded worker pool (created on first use, reused across pages)."""
+        if self._image_pool is None:
+            self._image_pool = ThreadPoolExecutor(max_workers=_IMAGE_WORKER_THREADS, thread_name_prefix='wiki-image')
+        return await asyncio.get_running_loop().run_in_executor(self._image_pool, _image_size, source)
+
+    def close(self) -> None:
+        """Close the shared HTTP client, the image worker pool and the module's event loop."""
+        if self._http is not None:
+            self._run_async(self._http.aclose())
+            self._http = None
+        if self._image_pool is not None:
+            self._image_pool.shutdown(wait=True)
+            self._image_pool = None
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    def cleanup_resources(self) -> None:
+        super().cleanup_resources()
+        try:
+            self.close()
+        except Exception as e:
+            self.log.warning(f"Wikipedia HTTP client cleanup error: {e}")
+
+    async def _download_images_async(self, candidates: List[Tuple[str, Optional[str]]], base_url: str,
+                                     download_folder: str, min_width: int, logger: StealthLogger) -> List[Optional[str]]:
+        """Fetch all candidate images concurrently. Returns saved paths (None for skipped images) in input order."""
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_IMAGE_DOWNLOADS)
+        client = self._get_http_client()
+        return await asyncio.gather(*(
+            self._download_one_image(client, semaphore, img_url, file_page_url, base_url, download_folder, min_width, logger)
+            for img_url, file_page_url in candidates
+        ))
+
+    async def _resolve_original_image_url(self, client: httpx.AsyncClient, file_page_url: str, base_url: str, logger: StealthLogger) -> Optional[str]:
+        """Look up the full-resolution media URL on a Wikipedia File: page (cached per module instance)."""
+        if file_page_url in self._file_page_cache:
+            return self._file_page_cache[file_page_url]
+        logger.debug("Found figure, attempting to get original from file page: %s", file_page_url)
+        original_url = await self._fetch_original_image_url(client, file_page_url, base_url, logger)
+        self._file_page_cache[file_page_url] = original_url
+        return original_url
+
+    async def _fetch_original_image_url(self, client: httpx.AsyncClient, file_page_url: str, base_url: str, logger: StealthLogger) -> Optional[str]:
+        try:
+            file_page_response = await client.get(file_page_url, timeout=10.0)
+            file_page_response.raise_for_status()
+            file_root = _parse_html(file_page_response.content)
+            
+            # Find the link to the actual media file on the file page
+            media_link_div = _first(_FILE_MEDIA_DIV_XP(file_root)) # Standard location for direct file link
+            if media_link_div is None: # Fallback if 'div#file' not found
+                media_link_div = _first(_FULL_IMAGE_LINK_DIV_XP(file_root)) # Older structure
+            if media_link_div is not None:
+                direct_media_link_tag = _first(_ANCHORS_XP(media_link_div))
+                if direct_media_link_tag is not None and direct_media_link_tag.get('href'):
+                    potential_original_url = urljoin(base_url, direct_media_link_tag.get('href'))
+                    if potential_original_url.startswith('//'):
+                        parsed_base_url = urlparse(base_url) # Re-parse if base_url was different for file page
+                        potential_original_url = f"{parsed_base_url.scheme}:{potential_original_url}"
+                    logger.debug("Got original image URL from file page: %s", potential_original_url)
+                    return potential_original_url
+        except httpx.RequestError as e_filepage:
+            logger.warning("HTTP error fetching file page %s: %s", file_page_url, e_filepage)
+        except Exception as e_file_parse:
+            logger.warning("Error parsing file page %s: %s", file_page_url, e_file_parse)
+        return None
+
+    async def _fetch_image_prefix(self, client: httpx.AsyncClient, img_url: str) -> Tuple[bytes, str, bool]:
+        """GET the first _IMAGE_PROBE_BYTES of an image via a Range request.
+
+        Returns (data, content type, is_complete). `data` is the whole image when it is no
+        larger than the probe. If the server ignores the Range header, only the probe is read
+        and the rest of the body is dropped, so memory stays bounded either way.
+        """
+        headers = {'Range': f"bytes=0-{_IMAGE_PROBE_BYTES - 1}"}
+        async with client.stream('GET', img_url, headers=headers) as response:
+            response.raise_for_status()
+            content_type = response.headers.get('content-type', '').lower()
+            chunks = response.aiter_bytes(_IMAGE_PROBE_BYTES)
+            try:
+                data = b''
+                async for data in chunks:
+                    break # The first chunk is the whole probe
+                if response.status_code == 206:
+                    total_size = response.headers.get('content-range', '').rpartition('/')[2]
+                    return data, content_type, total_size.isdigit() and int(total_size) <= len(data)
+                async for _ in chunks: # Range not honoured: any further data means the probe is incomplete
+                    return data, content_type, False
+                return data, content_type, True
+            finally:
+                await chunks.aclose()
+
+    async def _probe_image_size(self, client: httpx.AsyncClient,
+                                img_url: str) -> Tuple[bytes, str, bool, Optional[Tuple[int, int]]]:
+        """Fetch an image's leading bytes and read its dimensions from them.
+
+        Returns (data, content type, is_complete, (width, height) or None when the header
+        does not fit in the probe, e.g. JPEGs with large embedded metadata).
+        """
+        data, content_type, is_complete = await self._fetch_image_prefix(client, img_url)
+        size = _header_image_size(data)
+        if size is None:
             try:
-                # Initial check for width attribute (often a thumbnail)
-                attr_width = img_tag.get('width')
-                if attr_width and attr_width.isdigit() and int(attr_width) < min_width:
-                    logger.debug(f"Skipping image based on width attribute < {min_width}: {img_url}")
-                    continue
-
-                # Try to get the original image URL if it's a thumbnail (common in <figure>)
-                parent_figure = img_tag.find_parent('figure')
-                original_img_url = img_url # Start with current img_url
+                size = await self._image_size_off_loop(data)
+            except UnidentifiedImageError:
+                if is_complete:
+                    raise
+        return data, content_type, is_complete, size
+
+    async def _stream_image_to_file(self, client: httpx.AsyncClient, img_url: str, download_folder: str,
+                                    prefix: bytes = b'') -> Tuple[str, str]:
+        """Stream an image body to a temp file in `download_folder`. Returns (temp path, content type).
+
+        `prefix` (the already probed leading bytes) is written first and only the remainder is
+        requested; if the server answers with the full body instead, it replaces the prefix.
+        """
+        headers = {'Range': f"bytes={len(prefix)}-"} if prefix else None
+        with tempfile.NamedTemporaryFile(dir=download_folder, suffix='.part', delete=False) as tmp_file:
+            try:
+                async with client.stream('GET', img_url, headers=headers) as response:
+                    response.raise_for_status()
+                    if prefix and response.status_code == 206:
+                        tmp_file.write(prefix)
+                    async for chunk in response.aiter_bytes(_IMAGE_STREAM_CHUNK_BYTES):
+                        tmp_file.write(chunk)
+                    return tmp_file.name, response.headers.get('content-type', '').lower()
+            except BaseException:
+                tmp_file.close()
+                os.remove(tmp_file.name)
+                raise
+
+    async def _download_one_image(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, img_url: str,
+                                  file_page_url: Optional[str], base_url: str, download_folder: str,
+                                  min_width: int, logger: StealthLogger) -> Optional[str]:
+        """Download a single image if it meets `min_width`. Returns the saved path or None."""
+        original_img_url = img_url # Start with current img_url
+        partial_path: Optional[str] = None # Temp file holding a streamed body until it is kept or discarded
+        async with semaphore:
+            try:
+                if file_page_url:
+                    original_img_url = await self._resolve_original_image_url(client, file_page_url, base_url, logger) or img_url
+
+                # Read the image header first so undersized images are rejected without downloading their body
+                img_data, content_type, is_complete, size = await self._probe_image_size(client, original_img_url)
+                img_width, img_height = size or (None, None) # None: header did not fit in the probe; measure the full body below
+
+                if img_width is not None and img_width < min_width:
+                    logger.info("Skipping image (actual width %d < %d): %s", img_width, min_width, original_img_url)
+                    return None
+
+                if not is_complete:
+                    # Stream the rest of the (potentially original) image straight to a temp file in the target folder
+                    partial_path, content_type = await self._stream_image_to_file(client, original_img_url, download_folder, img_data)
+                    if img_width is None:
+                        img_width, img_height = await self._image_size_off_loop(partial_path)
+                        if img_width < min_width:
+                            logger.info("Skipping image (actual width %d < %d): %s", img_width, min_width, original_img_url)
+                            return None
+
+                logger.info("Image %s (%dx%d) meets size criteria (>= %dpx width). Downloading.", original_img_url, img_width, img_height, min_width)
                 
-                if parent_figure:
-                    link_to_file_page = parent_figure.find('a', class_='mw-file-description')
-                    if link_to_file_page and link_to_file_page.get('href'):
-                        file_page_url = urljoin(base_url, link_to_file_page.get('href'))
-                        logger.debug(f"Found figure, attempting to get original from file page: {file_page_url}")
-                        
-                        # Fetching file page content - this is an external HTTP call
-                        try:
-                            file_page_response = httpx.get(file_page_url, follow_redirects=True, timeout=10.0)
-                            file_page_response.raise_for_status()
-                            file_soup = BeautifulSoup(file_page_response.text, 'lxml')
-                            
-                            # Find the link to the actual media file on the file page
-                            media_link_div = file_soup.find('div', id='file') # Standard location for direct file link
-                            if media_link_div:
-                                direct_media_link_tag = media_link_div.find('a')
-                                if direct_media_link_tag and direct_media_link_tag.get('href'):
-                                    potential_original_url = urljoin(base_url, direct_media_link_tag.get('href'))
-                                    if potential_original_url.startswith('//'):
-                                        parsed_base_url = urlparse(base_url) # Re-parse if base_url was different for file page
-                                        potential_original_url = f"{parsed_base_url.scheme}:{potential_original_url}"
-                                    original_img_url = potential_original_url
-                                    logger.debug(f"Got original image URL from file page's direct media link: {original_img_url}")
-                            else: # Fallback if 'div#file' not found
-                                full_image_div = file_soup.find('div', class_='fullImageLink') # Older structure
-                                if full_image_div:
-                                    full_image_link_tag = full_image_div.find('a')
-                                    if full_image_link_tag and full_image_link_tag.get('href'):
-                                        potential_original_url = urljoin(base_url, full_image_link_tag.get('href'))
-                                        if potential_original_url.startswith('//'):
-                                            parsed_base_url = urlparse(base_url)
-                                            potential_original_url = f"{parsed_base_url.scheme}:{potential_original_url}"
-                                        original_img_url = potential_original_url
-                                        logger.debug(f"Got original image URL from file page's fullImageLink: {original_img_url}")
-                        except httpx.RequestError as e_filepage:
-                            logger.warning(f"HTTP error fetching file page {file_page_url}: {e_filepage}")
-                        except Exception as e_file_parse:
-                            logger.warning(f"Error parsing file page {file_page_url}: {e_file_parse}")
-
-                # Download the (potentially original) image data
-                img_response = httpx.get(original_img_url, timeout=20.0) # Increased timeout for larger images
-                img_response.raise_for_status()
-                img_data = img_response.content
-
-                # Check actual dimensions with Pillow
-                image_for_pillow = io.BytesIO(img_data)
-                img = Image.open(image_for_pillow)
+                # Create a valid filename
+                parsed_img_path = urlparse(original_img_url).path
+                img_basename = os.path.basename(parsed_img_path) if parsed_img_path else "wikipedia_image"
+                filename = img_basename.translate(_FILENAME_SAFE_TABLE)
                 
-                if img.width >= min_width:
-                    logger.info(f"Image {original_img_url} ({img.width}x{img.height}) meets size criteria (>= {min_width}px width). Downloading.")
-                    
-                    # Create a valid filename
-                    parsed_img_path = urlparse(original_img_url).path
-                    img_basename = os.path.basename(parsed_img_path) if parsed_img_path else "wikipedia_image"
-                    filename = re.sub(r'[^a-zA-Z0-9_\.\-]', '_', img_basename)
-                    
-                    # Ensure an extension
-                    if not os.path.splitext(filename)[1]:
-                        content_type = img_response.headers.get('content-type', '').lower()
-                        if 'image/jpeg' in content_type or 'image/jpg' in content_type: filename += ".jpg"
-                        elif 'image/png' in content_type: filename += ".png"
-                        elif 'image/gif' in content_type: filename += ".gif"
-                        elif 'image/webp' in content_type: filename += ".webp"
-                        else: filename += ".img" # Generic extension
-
-                    full_save_path = os.path.join(download_folder, filename)
-                    
-                    # Avoid overwriting: if file exists, add a suffix
-                    counter = 1
-                    temp_path = full_save_path
-                    while os.path.exists(temp_path):
-                        name, ext = os.path.splitext(full_save_path)
-                        temp_path = f"{name}_{counter}{ext}"
-                        counter += 1
-                    full_save_path = temp_path
-                        
-                    with open(full_save_path, 'wb') as f:
-                        f.write(img_data)
-                    downloaded_image_paths.append(full_save_path)
-                    logger.debug(f"Saved image to {full_save_path}")
+                # Ensure an extension
+                if not os.path.splitext(filename)[1]:
+                    media_type = content_type.split(';', 1)[0].strip() # Drop parameters such as '; charset=...'
+                    filename += _CONTENT_TYPE_EXTENSIONS.get(media_type, ".img") # Generic extension if unknown
+
+                full_save_path = os.path.join(download_folder, filename)
+                
+                # Avoid overwriting: claim a unique name up front (random suffix on collision)
+                fd, full_save_path = _create_unique_file(full_save_path)
+                if partial_path:
+                    os.close(fd)
+                    os.replace(partial_path, full_save_path) # Atomically swaps the streamed body in for the empty placeholder
+                    partial_path = None
                 else:
-                    logger.info(f"Skipping image (actual width {img.width} < {min_width}): {original_img_url}")
+                    _write_all(fd, img_data)
+                logger.debug("Saved image to %s", full_save_path)
+                return full_save_path
             
             except httpx.HTTPStatusError as e_status: # Specific error for bad status
-                 logger.warning(f"HTTP error {e_status.response.status_code} downloading image {original_img_url if 'original_img_url' in locals() else img_url}: {e_status}")
+                 logger.warning("HTTP error %d downloading image %s: %s", e_status.response.status_code, original_img_url, e_status)
             except httpx.RequestError as e_req: # Other request errors (timeout, connection, etc.)
-                 logger.warning(f"Request error downloading image {original_img_url if 'original_img_url' in locals() else img_url}: {e_req}")
+                 logger.warning("Request error downloading image %s: %s", original_img_url, e_req)
             except IOError: # Pillow can raise IOError for non-image files or corrupt images
-                logger.warning(f"Pillow could not open or identify image from {original_img_url if 'original_img_url' in locals() else img_url}. Skipping.")
+                logger.warning("Pillow could not open or identify image from %s. Skipping.", original_img_url)
             except Exception as e_img: # Catch-all for other unexpected errors during image processing
-                logger.error(f"Unexpected error processing image {original_img_url if 'original_img_url' in locals() else img_url}: {e_img}", exc_info=True)
-        
-        return downloaded_image_paths
+                logger.error("Unexpected error processing image %s: %s", original_img_url, e_img, exc_info=True)
+            finally:
+                if partial_path and os.path.exists(partial_path):
+                    os.remove(partial_path)
+        return None
 
 # Selenium helper functions from the original file - can be refactored into the class or utils
 # For now, they are not directly used by the refactored WikipediaSiteModule's get_data method above.
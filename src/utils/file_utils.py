@@ -29,25 +29,25 @@ def ensure_directory_exists(dir_path: pathlib.Path, logger: Optional[GenericLogg
     Returns:
         True if the directory exists or was successfully created, False otherwise.
     """
-    if dir_path.exists():
+    # Try to create it straight away: one mkdir covers both the "missing" and the "already there" case,
+    # and a concurrent creator cannot slip in between a check and the create.
+    try:
+        dir_path.mkdir(parents=True)
+    except FileExistsError:
         if dir_path.is_dir():
             if logger:
                 logger.debug(f"Directory already exists: {dir_path}")
             return True
-        else:
-            if logger:
-                logger.error(f"Path exists but is not a directory: {dir_path}")
-            return False
-    else:
-        try:
-            dir_path.mkdir(parents=True, exist_ok=True)
-            if logger:
-                logger.info(f"Successfully created directory: {dir_path}")
-            return True
-        except Exception as e:
-            if logger:
-                logger.error(f"Failed to create directory {dir_path}: {e}")
-            return False
+        if logger:
+            logger.error(f"Path exists but is not a directory: {dir_path}")
+        return False
+    except Exception as e:
+        if logger:
+            logger.error(f"Failed to create directory {dir_path}: {e}")
+        return False
+    if logger:
+        logger.info(f"Successfully created directory: {dir_path}")
+    return True
 
 def is_valid_chrome_profile_dir(profile_path: pathlib.Path, logger: Optional[GenericLogger] = None) -> bool:
     """
@@ -61,25 +61,30 @@ def is_valid_chrome_profile_dir(profile_path: pathlib.Path, logger: Optional[Gen
     Returns:
         True if it seems like a valid profile directory, False otherwise.
     """
-    if not profile_path.is_dir():
+    # One directory listing instead of a stat per essential item; also tells us whether it is a directory at all.
+    try:
+        with os.scandir(profile_path) as entries:
+            present = {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
         if logger:
             logger.debug(f"Profile path {profile_path} is not a directory.")
         return False
+    except OSError as e:
+        if logger:
+            logger.debug(f"Profile path {profile_path} could not be listed: {e}")
+        return False
 
     # List of essential items that should exist in a Chrome profile directory.
     # 'Preferences' and 'Cookies' are usually key.
     # 'Local Storage' and 'Session Storage' are also important for session data.
     essential_items = ["Preferences", "Cookies", "Local Storage", "Session Storage"]
-    found_all_essentials = True
+    missing_items = [item_name for item_name in essential_items if item_name not in present]
+    found_all_essentials = not missing_items
 
-    for item_name in essential_items:
-        item_path = profile_path / item_name
-        if not item_path.exists():
-            if logger:
-                logger.debug(f"Essential Chrome profile item not found: {item_path}")
-            found_all_essentials = False
-            # We can break early if one essential is missing, but checking all might give more debug info.
-            # For now, let's log and continue to see all missing items if verbose logging is on.
+    if logger:
+        # Log every missing item (not just the first) for verbose debugging.
+        for item_name in missing_items:
+            logger.debug(f"Essential Chrome profile item not found: {profile_path / item_name}")
     
     if not found_all_essentials:
         if logger:
@@ -90,11 +95,13 @@ def is_valid_chrome_profile_dir(profile_path: pathlib.Path, logger: Optional[Gen
         logger.debug(f"Path {profile_path} appears to be a valid Chrome profile directory.")
     return True
 
-if __name__ == '__main__':
+# The example below creates and removes files in the working directory, so it only runs on request
+if __name__ == '__main__' and os.environ.get('RUN_FILE_UTILS_SMOKE'):
     # Example Usage
     class DummyLogger:
         def info(self, msg): print(f"INFO: {msg}")
         def debug(self, msg): print(f"DEBUG: {msg}")
+        def warning(self, msg): print(f"WARNING: {msg}")
         def error(self, msg): print(f"ERROR: {msg}")
 
     log = DummyLogger()
@@ -8,10 +8,71 @@ All errors and debug output are written to debug-log.txt for easy troubleshootin
 """
 
 import sys
+import atexit
 import logging
+import queue
 import re
+import threading
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+
+# Credential-like key/value pairs masked in every log message
+_SENSITIVE_PATTERNS = [ # (group name, pattern, replacement)
+    ('password', r'password["\s]*[:=]["\s]*[^"\s,}]+', 'password="***"'),
+    ('token', r'token["\s]*[:=]["\s]*[^"\s,}]+', 'token="***"'),
+    ('api_key', r'api[_-]?key["\s]*[:=]["\s]*[^"\s,}]+', 'api_key="***"'),
+    # Credential key names only; other *_key values (selector groups, element keys) stay readable
+    ('secret_key', r'secret[_\s-]?key["\s]*[:=]["\s]*[^"\s,}]+', 'secret_key="***"'),
+    ('access_key', r'access[_\s-]?key["\s]*[:=]["\s]*[^"\s,}]+', 'access_key="***"'),
+    ('private_key', r'private[_\s-]?key["\s]*[:=]["\s]*[^"\s,}]+', 'private_key="***"'),
+    ('secret', r'secret["\s]*[:=]["\s]*[^"\s,}]+', 'secret="***"'),
+    ('auth', r'auth["\s]*[:=]["\s]*[^"\s,}]+', 'auth="***"'),
+]
+# All patterns fused into one alternation so a message is scanned in a single pass
+_SENSITIVE_RE = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern, _ in _SENSITIVE_PATTERNS), re.IGNORECASE)
+_SENSITIVE_REPLACEMENTS = {name: replacement for name, _, replacement in _SENSITIVE_PATTERNS}
+# Every pattern contains one of these literals; messages without any of them skip the regex entirely
+_SENSITIVE_KEYWORDS = ("password", "token", "key", "secret", "auth")
+
+
+def _mask_sensitive(match: re.Match) -> str:
+    return _SENSITIVE_REPLACEMENTS[match.lastgroup]
+
+
+def _sanitize(msg: str) -> str:
+    """Mask credentials in a fully formatted log message"""
+    # casefold() matches what IGNORECASE treats as equal (e.g. U+017F for 's'), so nothing is skipped wrongly
+    try:
+        folded = msg.casefold()
+    except AttributeError: # Non-str message (e.g. an exception object); rare, so no per-call isinstance check
+        msg = str(msg)
+        folded = msg.casefold()
+    if not any(keyword in folded for keyword in _SENSITIVE_KEYWORDS):
+        return msg
+    return _SENSITIVE_RE.sub(_mask_sensitive, msg)
+
+
+class _SanitizeFilter(logging.Filter):
+    """Handler filter that masks credentials in the merged message and arguments.
+
+    Handler filters only run once the record has passed that handler's level check,
+    so calls no handler will emit are never sanitized. The record is rewritten in
+    place, so the next handler sees the flag and skips the work.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "sensitive_filtered", False):
+            try:
+                record.msg = _sanitize(record.getMessage())
+                record.args = None
+            except Exception:
+                # Filters run outside emit()'s error handling, so a bad format string would raise into the
+                # caller. Leave the args in place; the handler then reports the error via handleError().
+                record.msg = _sanitize(str(record.msg))
+            record.sensitive_filtered = True
+        return True
 
 
 class StealthLogger:
@@ -19,6 +80,12 @@ class StealthLogger:
 
     # Class-level debug log file for all instances
     DEBUG_LOG_FILE = Path("debug-log.txt")
+    # One handler (and file descriptor) on DEBUG_LOG_FILE shared by every instance, created on first use.
+    # Records are buffered and written in batches; a WARNING or above writes the batch out immediately.
+    _DEBUG_HANDLER: Optional[MemoryHandler] = None
+    DEBUG_BUFFER_RECORDS = 50
+    # Background threads writing each logger's file handlers, by logger name
+    _LISTENERS: Dict[str, QueueListener] = {}
 
     def __init__(self, log_file: Path = None, level: str = "DEBUG", name: str = "stealth-system"):
         self.log_file = log_file or Path("stealth-system.log")
@@ -31,7 +98,9 @@ class StealthLogger:
         logger.setLevel(logging.DEBUG)  # Always capture everything internally
 
         # Clear existing handlers to avoid duplicates
+        self._stop_listener(self.name)
         logger.handlers.clear()
+        file_handlers = [] # Written by a background listener so disk I/O stays off the calling thread
 
         # Formatter with more detail for debugging
         file_formatter = logging.Formatter(
@@ -40,6 +109,7 @@ class StealthLogger:
         console_formatter = logging.Formatter(
             "%(asctime)s | %(levelname)-8s | %(message)s"
         )
+        sanitize_filter = _SanitizeFilter()
 
         # Main log file handler (all levels)
         if self.log_file:
@@ -48,70 +118,81 @@ class StealthLogger:
                 file_handler = logging.FileHandler(self.log_file, mode="a", encoding="utf-8")
                 file_handler.setLevel(logging.DEBUG)
                 file_handler.setFormatter(file_formatter)
-                logger.addHandler(file_handler)
+                file_handler.addFilter(sanitize_filter)
+                file_handlers.append(file_handler)
             except Exception as e:
                 print(f"Warning: Could not create log file handler for {self.log_file}: {e}")
 
         # Debug log file handler (always writes to debug-log.txt)
-        try:
-            debug_handler = logging.FileHandler(self.DEBUG_LOG_FILE, mode="a", encoding="utf-8")
-            debug_handler.setLevel(logging.DEBUG)
-            debug_handler.setFormatter(file_formatter)
-            logger.addHandler(debug_handler)
-        except Exception as e:
-            print(f"Warning: Could not create debug log handler: {e}")
+        if StealthLogger._DEBUG_HANDLER is None:
+            try:
+                debug_handler = logging.FileHandler(self.DEBUG_LOG_FILE, mode="a", encoding="utf-8")
+                debug_handler.setLevel(logging.DEBUG)
+                debug_handler.setFormatter(file_formatter)
+                debug_handler.addFilter(sanitize_filter)
+                StealthLogger._DEBUG_HANDLER = MemoryHandler(
+                    self.DEBUG_BUFFER_RECORDS, flushLevel=logging.WARNING, target=debug_handler
+                )
+            except Exception as e:
+                print(f"Warning: Could not create debug log handler: {e}")
+        if StealthLogger._DEBUG_HANDLER is not None:
+            file_handlers.append(StealthLogger._DEBUG_HANDLER)
+
+        if file_handlers:
+            log_queue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, *file_handlers, respect_handler_level=True)
+            listener.start()
+            StealthLogger._LISTENERS[self.name] = listener
+            logger.addHandler(QueueHandler(log_queue))
 
         # Console handler (configurable level)
         console_handler = logging.StreamHandler(sys.stdout)
         console_level = getattr(logging, level.upper(), logging.INFO)
         console_handler.setLevel(console_level)
         console_handler.setFormatter(console_formatter)
+        console_handler.addFilter(sanitize_filter)
         logger.addHandler(console_handler)
 
         return logger
 
+    @staticmethod
+    def _stop_listener(name: str):
+        """Flush and stop the file-writing listener of logger `name`, closing its own file handler"""
+        listener = StealthLogger._LISTENERS.pop(name, None)
+        if listener is None:
+            return
+        listener.stop()  # Blocks until every queued record has been written
+        for handler in listener.handlers:
+            if handler is not StealthLogger._DEBUG_HANDLER:
+                handler.close()
+
     def debug(self, msg: str, *args, exc_info: bool = False, **kwargs):
         """Security-filtered debug logging"""
-        self.logger.debug(self._filter_sensitive(str(msg)), *args, exc_info=exc_info, **kwargs)
+        self.logger.debug(msg, *args, exc_info=exc_info, **kwargs)
 
     def info(self, msg: str, *args, exc_info: bool = False, **kwargs):
         """Security-filtered info logging"""
-        self.logger.info(self._filter_sensitive(str(msg)), *args, exc_info=exc_info, **kwargs)
+        self.logger.info(msg, *args, exc_info=exc_info, **kwargs)
 
     def warning(self, msg: str, *args, exc_info: bool = False, **kwargs):
         """Security-filtered warning logging"""
-        self.logger.warning(self._filter_sensitive(str(msg)), *args, exc_info=exc_info, **kwargs)
+        self.logger.warning(msg, *args, exc_info=exc_info, **kwargs)
 
     def error(self, msg: str, *args, exc_info: bool = True, **kwargs):
         """Security-filtered error logging with exception info by default"""
-        self.logger.error(self._filter_sensitive(str(msg)), *args, exc_info=exc_info, **kwargs)
+        self.logger.error(msg, *args, exc_info=exc_info, **kwargs)
 
     def critical(self, msg: str, *args, exc_info: bool = True, **kwargs):
         """Security-filtered critical logging with exception info"""
-        self.logger.critical(self._filter_sensitive(str(msg)), *args, exc_info=exc_info, **kwargs)
+        self.logger.critical(msg, *args, exc_info=exc_info, **kwargs)
 
     def exception(self, msg: str, *args, **kwargs):
         """Log an exception with full traceback"""
-        self.logger.exception(self._filter_sensitive(str(msg)), *args, **kwargs)
+        self.logger.exception(msg, *args, **kwargs)
 
     def _filter_sensitive(self, msg: str) -> str:
         """Filter sensitive information from logs"""
-        if not isinstance(msg, str):
-            msg = str(msg)
-
-        patterns = [
-            (r'password["\s]*[:=]["\s]*[^"\s,}]+', 'password="***"'),
-            (r'token["\s]*[:=]["\s]*[^"\s,}]+', 'token="***"'),
-            (r'api[_-]?key["\s]*[:=]["\s]*[^"\s,}]+', 'api_key="***"'),
-            (r'secret["\s]*[:=]["\s]*[^"\s,}]+', 'secret="***"'),
-            (r'auth["\s]*[:=]["\s]*[^"\s,}]+', 'auth="***"'),
-        ]
-
-        filtered = msg
-        for pattern, replacement in patterns:
-            filtered = re.sub(pattern, replacement, filtered, flags=re.IGNORECASE)
-
-        return filtered
+        return _sanitize(msg)
 
     def log_separator(self, title: str = ""):
         """Log a visual separator for readability"""
@@ -122,6 +203,20 @@ class StealthLogger:
             self.info(sep_line)
 
 
+@atexit.register
+def _stop_all_listeners():
+    """Write out queued and buffered records before logging.shutdown() closes the handlers at exit"""
+    for name in list(StealthLogger._LISTENERS):
+        StealthLogger._stop_listener(name)
+    if StealthLogger._DEBUG_HANDLER is not None:
+        StealthLogger._DEBUG_HANDLER.flush()
+
+
+# get_logger() instances by argument tuple, so handlers and log files are only set up once
+_LOGGER_CACHE: Dict[Tuple[str, Optional[Path], str], StealthLogger] = {}
+_LOGGER_CACHE_LOCK = threading.Lock()  # Concurrent first calls must not set up the same logger twice
+
+
 def get_logger(name: str = "stealth-system", log_file: Optional[Path] = None, level: str = "INFO") -> StealthLogger:
     """Get a configured logger instance
 
@@ -131,6 +226,13 @@ def get_logger(name: str = "stealth-system", log_file: Optional[Path] = None, le
         level: Console logging level (file always logs DEBUG)
 
     Returns:
-        StealthLogger instance
+        StealthLogger instance (shared by all calls with the same arguments)
     """
-    return StealthLogger(log_file=log_file, level=level, name=name)
+    key = (name, log_file, level) # Path is hashable, so the arguments key the cache directly
+    logger = _LOGGER_CACHE.get(key)
+    if logger is None:
+        with _LOGGER_CACHE_LOCK:
+            logger = _LOGGER_CACHE.get(key)
+            if logger is None:
+                logger = _LOGGER_CACHE[key] = StealthLogger(log_file=log_file, level=level, name=name)
+    return logger
@@ -7,12 +7,19 @@ Provides custom JSON encoding for complex data structures used in the project.
 """
 
 import json
+try:
+    import orjson # Optional: Rust encoder, several times faster than json.dumps with a Python-level default()
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 from datetime import datetime, date
-from dataclasses import is_dataclass, asdict
+from dataclasses import fields, is_dataclass
+from operator import attrgetter
 from selenium.webdriver.remote.webelement import WebElement
 from pathlib import Path
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Dict, List, Tuple, Union
+from weakref import WeakKeyDictionary
 
 # Attempt to import ExtractedElement and ElementProperties. 
 # This might create a circular dependency if utils is imported by core.structures.
@@ -25,34 +32,141 @@ from typing import Any
 # However, for asdict to work well with dataclasses, direct type checking is better.
 # Let's assume for now this util is standalone or imported by higher-level modules like main.py.
 
+def _field_reader(cls: type) -> Tuple[Tuple[str, ...], Callable[[Any], tuple]]:
+    """(field names, reader returning their values) for a dataclass type.
+
+    raw WebElement handles are excluded. attrgetter fetches every field in a single C call,
+    but returns a bare value for one name (and needs at least one), hence the fallback.
+    """
+    names = tuple(f.name for f in fields(cls) if f.name != 'raw_webelement')
+    if len(names) > 1:
+        return names, attrgetter(*names)
+    return names, lambda o: tuple(getattr(o, name) for name in names)
+
+
+# Label per live WebElement, built once: tag_name is a WebDriver round trip and the f-string is rebuilt otherwise
+_WEBELEMENT_REPRS: 'WeakKeyDictionary[WebElement, str]' = WeakKeyDictionary()
+
+
+def _webelement_repr(element: WebElement) -> str:
+    label = _WEBELEMENT_REPRS.get(element)
+    if label is None:
+        label = _WEBELEMENT_REPRS[element] = f"<WebElement: {element.tag_name} id={element.id[:8]}...>"
+    return label
+
+
+def _value_label(element: Any, value: WebElement) -> str:
+    """Label for an ExtractedElement's WebElement value.
+
+    Cached on the instance as (element, label), either at capture time or on first encode, because
+    each tag_name lookup is a WebDriver round trip; it is paid at most once per element.
+    """
+    try:
+        cached = element._value_repr
+    except AttributeError: # Not captured with properties and not encoded before
+        cached = None
+    if cached is None or cached[0] is not value:
+        cached = element._value_repr = (value, _webelement_repr(value))
+    return cached[1]
+
+
+def _handler_for(cls: type) -> Callable[[Any], Any]:
+    """Build the conversion function for instances of `cls` (introspection happens once per type)."""
+    if is_dataclass(cls):
+        # Shallow dict of the fields; the encoder recurses into nested dataclasses by calling _default again,
+        # so nothing is deep-copied (unlike asdict) and raw_webelement is dropped at every level.
+        names, read_values = _field_reader(cls)
+        if cls.__name__ != 'ExtractedElement' or 'value' not in names:
+            return lambda o: dict(zip(names, read_values(o)))
+        value_index = names.index('value') # Position in the reader's tuple, so no dict lookup per element
+
+        def extracted_element_to_dict(o: Any) -> dict:
+            values = read_values(o)
+            d = dict(zip(names, values))
+            # Handle ExtractedElement.value if it's a WebElement
+            value = values[value_index]
+            if isinstance(value, WebElement):
+                d['value'] = _value_label(o, value)
+            return d
+        return extracted_element_to_dict
+    elif issubclass(cls, datetime):
+        return datetime.isoformat
+    elif issubclass(cls, WebElement):
+        # This case should ideally be handled within the dataclass conversion,
+        # but as a fallback if a WebElement is passed directly.
+        return lambda o: f"{_webelement_repr(o)} (Unserializable - should be handled in dataclass)"
+    elif issubclass(cls, Path):
+        return str
+
+    def unserializable(o: Any) -> Any:
+        raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
+    return unserializable
+
+
+# Conversion function per concrete type, filled in lazily by _default
+_HANDLERS: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _default(o: Any) -> Any:
+    """Convert a project-specific object into something JSON can encode (shared by both encoders)."""
+    cls = type(o)
+    handler = _HANDLERS.get(cls)
+    if handler is None:
+        handler = _HANDLERS[cls] = _handler_for(cls)
+    return handler(o)
+
+
 class CustomJsonEncoder(json.JSONEncoder):
     """Custom JSON Encoder for project-specific data structures."""
     def default(self, o: Any) -> Any:
-        if is_dataclass(o) and not isinstance(o, type):
-            # For dataclasses, convert to dict. Handle WebElement fields specifically.
-            d = asdict(o)
-            # Remove raw_webelement from ElementProperties before serialization
-            if o.__class__.__name__ == 'ElementProperties':
-                d.pop('raw_webelement', None)
-            
-            # Handle ExtractedElement.value if it's a WebElement
-            if o.__class__.__name__ == 'ExtractedElement':
-                if 'properties' in d and d['properties'] is not None and 'raw_webelement' in d['properties']:
-                     d['properties'].pop('raw_webelement', None) # Ensure it's removed from nested ElementProperties
-                
-                element_value = getattr(o, 'value', None) # Use getattr to safely access .value
-                if isinstance(element_value, WebElement):
-                    d['value'] = f"<WebElement: {element_value.tag_name} id={element_value.id[:8]}...>"
-            return d
-        elif isinstance(o, datetime):
-            return o.isoformat()
-        elif isinstance(o, WebElement):
-            # This case should ideally be handled within the dataclass conversion,
-            # but as a fallback if a WebElement is passed directly.
-            return f"<WebElement: {o.tag_name} id={o.id[:8]}...> (Unserializable - should be handled in dataclass)"
-        
-        # Let the base class default method raise the TypeError for other types
-        return super().default(o)
+        return _default(o)
+
+
+if ORJSON_AVAILABLE:
+    # Dataclasses go through _default (not orjson's native support) so WebElement fields are stripped
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize `obj` to UTF-8 JSON bytes, using orjson when installed and CustomJsonEncoder otherwise.
+
+    Output is compact by default; `pretty` (2-space indent) is meant for output a person reads.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if pretty else 0))
+    return json.dumps(obj, cls=CustomJsonEncoder, ensure_ascii=False, indent=2 if pretty else None).encode('utf-8')
+
+
+def dump_to_file(path: Union[str, Path], obj: Any, pretty: bool = False) -> None:
+    """Write `obj` as JSON to `path` without holding a str copy of the whole document.
+
+    With orjson the encoded bytes are written in one call; the stdlib fallback streams
+    CustomJsonEncoder.iterencode() chunks straight into the file instead of joining them first.
+    """
+    with open(path, 'wb') as fp:
+        if ORJSON_AVAILABLE:
+            fp.write(dumps(obj, pretty))
+            return
+        encoder = CustomJsonEncoder(ensure_ascii=False, indent=2 if pretty else None)
+        for chunk in encoder.iterencode(obj):
+            fp.write(chunk.encode('utf-8'))
+
+
+def serialize_extracted_batch(elements: List[Any], pretty: bool = False) -> bytes:
+    """Serialize a list of ExtractedElement (or any one dataclass type) column-wise.
+
+    Produces {field name: [value per element, ...]} instead of one object per element, so
+    field names appear once and the columns are gathered with C-level map/zip rather than
+    a _default call per element. Element i is recovered by taking index i of every column.
+    """
+    if not elements:
+        return dumps({}, pretty)
+    names, read_values = _field_reader(type(elements[0]))
+    columns = dict(zip(names, map(list, zip(*map(read_values, elements)))))
+    values = columns.get('value')
+    if values is not None:
+        columns['value'] = [_value_label(o, v) if isinstance(v, WebElement) else v for o, v in zip(elements, values)]
+    return dumps(columns, pretty)
 
 
 # Example Usage (for testing purposes, not part of the module's primary code)
@@ -101,9 +215,9 @@ if __name__ == '__main__':
     }
     
     try:
-        json_output = json.dumps(data_to_serialize, cls=CustomJsonEncoder, indent=4)
+        json_output = dumps(data_to_serialize, pretty=True)
         print("\nSerialized JSON Output:")
-        print(json_output)
+        print(json_output.decode('utf-8'))
     except Exception as e:
         print(f"\nError during serialization test: {e}")
 
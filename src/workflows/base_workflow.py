@@ -8,43 +8,75 @@ Abstract base class for all automation workflows.
 
 import time
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Dict, Any, Optional
 
 from core import SystemConfig, StealthBrowserManager, HumanBehaviorEngine, AdaptiveDOMInteractor
 from utils.logger import get_logger, StealthLogger
 from core.config import WorkflowConfig
+from selenium.common.exceptions import TimeoutException
+
+
+# Function of timeoutMs resolving with true once document.readyState is 'complete' (pushed by the
+# readystatechange event, no polling), or with the final readiness check once the timeout elapses.
+_PAGE_READY_JS = """(timeoutMs => new Promise(resolve => {
+    if (document.readyState === 'complete') { resolve(true); return; }
+    const timer = setTimeout(() => resolve(document.readyState === 'complete'), timeoutMs);
+    document.addEventListener('readystatechange', () => {
+        if (document.readyState === 'complete') { clearTimeout(timer); resolve(true); }
+    });
+}))"""
+
+
+# Pause before navigation retry n (0-based) is about base * 2**n seconds (capped), jittered by +/-50%
+_RETRY_BACKOFF_BASE_SECONDS = 0.5
+_RETRY_BACKOFF_CAP_SECONDS = 4.0
+
+
+_SCALAR_PARAM_TYPES = (int, float, str, bool, type(None))
+
+
+def _summarize_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of `params` for execution_data: JSON scalars kept, anything else replaced by its type name.
+
+    Keeps results from pinning large objects (drivers, configs) and from serializing them again.
+    """
+    return {key: value if isinstance(value, _SCALAR_PARAM_TYPES) else type(value).__name__
+            for key, value in params.items()}
 
 
 class BaseWorkflow(ABC):
     """Abstract base class for automation workflows"""
 
-    def __init__(self, config: SystemConfig = None, logger: StealthLogger = None,
-                 init_components: bool = True):
+    def __init__(self, config: SystemConfig = None, logger: StealthLogger = None):
         """Initialize workflow.
 
+        browser_manager, behavior and dom are built on first access. Subclasses that
+        manage these differently simply assign the attribute, which replaces the lazy default.
+
         Args:
             config: System configuration
             logger: Logger instance
-            init_components: If True, initialize browser_manager, behavior, dom.
-                           Subclasses can set False if they manage these differently.
         """
         self.config = config or SystemConfig()
         self.log = logger or StealthLogger()
 
-        # Initialize core components only if requested
-        # Subclasses like BaseSiteModule may handle this themselves
-        if init_components:
-            self.browser_manager = StealthBrowserManager(self.config, self.log)
-            self.behavior = HumanBehaviorEngine(self.config, self.log)
-            self.dom = AdaptiveDOMInteractor(self.config, self.log)
-        else:
-            self.browser_manager = None
-            self.behavior = None
-            self.dom = None
-
-        self.start_time = None
+        self.start_time = None  # Wall-clock start (reported in execution_data)
+        self._start_monotonic = None  # Monotonic start; durations are measured from this
         self.execution_data = {}
     
+    @cached_property
+    def browser_manager(self) -> Optional[StealthBrowserManager]:
+        return StealthBrowserManager(self.config, self.log)
+
+    @cached_property
+    def behavior(self) -> Optional[HumanBehaviorEngine]:
+        return HumanBehaviorEngine(self.config, self.log)
+
+    @cached_property
+    def dom(self) -> AdaptiveDOMInteractor:
+        return AdaptiveDOMInteractor(self.config, self.log)
+
     @abstractmethod
     def execute(self, **params) -> Dict[str, Any]:
         """Execute the workflow with given parameters"""
@@ -57,18 +89,22 @@ class BaseWorkflow(ABC):
     
     def start_execution(self, **params) -> Dict[str, Any]:
         """Start workflow execution with common setup"""
+        workflow_type = type(self).__name__
         self.start_time = time.time()
-        self.log.info(f"Starting {self.__class__.__name__} workflow")
+        # Durations use the monotonic clock so NTP/wall-clock adjustments cannot skew execution_time
+        t0 = self._start_monotonic = time.monotonic()
+        self.log.info(f"Starting {workflow_type} workflow")
         
         # Validate parameters
         if not self.validate_params(**params):
+            # No t0 here: site modules override _create_error_result with other positional parameters
             return self._create_error_result("Parameter validation failed")
         
         # Initialize execution data
         self.execution_data = {
-            'workflow_type': self.__class__.__name__,
+            'workflow_type': workflow_type,
             'start_time': self.start_time,
-            'params': params,
+            'params': _summarize_params(params),
             'success': False,
             'errors': [],
             'execution_time': 0
@@ -80,10 +116,10 @@ class BaseWorkflow(ABC):
             
             # Update execution data
             self.execution_data.update(result)
-            self.execution_data['execution_time'] = time.time() - self.start_time
+            execution_time = self.execution_data['execution_time'] = time.monotonic() - t0
             
             if result.get('success'):
-                self.log.info(f"Workflow completed successfully in {self.execution_data['execution_time']:.2f}s")
+                self.log.info(f"Workflow completed successfully in {execution_time:.2f}s")
             else:
                 self.log.error(f"Workflow failed: {', '.join(result.get('errors', []))}")
             
@@ -91,24 +127,30 @@ class BaseWorkflow(ABC):
             
         except Exception as e:
             self.execution_data['errors'].append(str(e))
-            self.execution_data['execution_time'] = time.time() - self.start_time
+            self.execution_data['execution_time'] = time.monotonic() - t0
             self.log.error(f"Workflow exception: {e}")
             return self.execution_data
     
-    def _create_error_result(self, error_message: str) -> Dict[str, Any]:
+    def _elapsed_since(self, t0: Optional[float]) -> float:
+        """Seconds since monotonic time `t0` (default: the current execution's start; 0 if not started)"""
+        if t0 is None:
+            t0 = self._start_monotonic
+        return time.monotonic() - t0 if t0 is not None else 0
+    
+    def _create_error_result(self, error_message: str, t0: Optional[float] = None) -> Dict[str, Any]:
         """Create standardized error result"""
         return {
             'success': False,
             'errors': [error_message],
-            'execution_time': time.time() - (self.start_time or time.time())
+            'execution_time': self._elapsed_since(t0)
         }
     
-    def _create_success_result(self, data: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _create_success_result(self, data: Dict[str, Any] = None, t0: Optional[float] = None) -> Dict[str, Any]:
         """Create standardized success result"""
         result = {
             'success': True,
             'errors': [],
-            'execution_time': time.time() - (self.start_time or time.time())
+            'execution_time': self._elapsed_since(t0)
         }
         
         if data:
@@ -116,8 +158,13 @@ class BaseWorkflow(ABC):
         
         return result
     
-    def navigate_with_retry(self, driver, url: str, max_retries: int = 3) -> bool:
-        """Navigate to URL with retry logic"""
+    def navigate_with_retry(self, driver, url: str, max_retries: int = 3, max_total_seconds: float = 8.0) -> bool:
+        """Navigate to URL with retry logic.
+
+        Pauses between attempts grow exponentially (with human-like jitter), and no retry is
+        started that would end past `max_total_seconds` from the first attempt.
+        """
+        deadline = time.monotonic() + max_total_seconds
         for attempt in range(max_retries):
             try:
                 driver.get(url)
@@ -126,27 +173,57 @@ class BaseWorkflow(ABC):
             except Exception as e:
                 self.log.warning(f"Navigation attempt {attempt + 1}/{max_retries} failed: {e}")
                 if attempt < max_retries - 1:
-                    self.behavior.human_pause(1.0, 2.0)
+                    delay = min(_RETRY_BACKOFF_CAP_SECONDS, _RETRY_BACKOFF_BASE_SECONDS * 2 ** attempt)
+                    if time.monotonic() + delay * 1.5 >= deadline:
+                        self.log.warning(f"Navigation retry budget of {max_total_seconds:.1f}s exhausted for {url}")
+                        break
+                    self.behavior.human_pause(delay * 0.5, delay * 1.5)
         return False
 
     def wait_for_page_ready(self, driver, timeout: int = 10) -> bool:
         """Wait for page to be ready for interaction"""
         try:
-            # Wait for document ready state
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                ready_state = driver.execute_script("return document.readyState")
-                if ready_state == "complete":
-                    # Additional thinking time for human-like behavior
-                    self.behavior.thinking_pause()
-                    return True
-                time.sleep(0.1)
+            # Wait for document ready state in the browser itself: one round trip instead of polling
+            evaluated, ready = self._evaluate_js_promise(driver, f"{_PAGE_READY_JS}({int(timeout * 1000)})")
+            if not evaluated: # No CDP (non-Chromium driver): same promise through WebDriver
+                ready = driver.execute_async_script(
+                    f"{_PAGE_READY_JS}(arguments[0]).then(arguments[arguments.length - 1]);", int(timeout * 1000))
+            if ready:
+                # Additional thinking time for human-like behavior
+                self.behavior.thinking_pause()
+                return True
+            self.log.warning("Page did not reach ready state within timeout")
+            return False
+        except TimeoutException: # timeout exceeds the driver's script timeout
             self.log.warning("Page did not reach ready state within timeout")
             return False
         except Exception as e:
             self.log.warning(f"Page ready check failed: {e}")
             return False
     
+    def _evaluate_js_promise(self, driver, expression: str):
+        """Evaluate a promise-returning JS expression via CDP and wait for it to settle.
+
+        CDP Runtime.evaluate is not bound by the WebDriver script timeout.
+        Returns (True, value) on success or (False, None) if the driver cannot evaluate it.
+        """
+        if not hasattr(driver, 'execute_cdp_cmd'): # Non-Chromium driver
+            return False, None
+        try:
+            response = driver.execute_cdp_cmd("Runtime.evaluate", {
+                "expression": expression,
+                "awaitPromise": True,
+                "returnByValue": True
+            })
+        except Exception as e:
+            self.log.debug("CDP promise evaluation unavailable: %s", e)
+            return False, None
+
+        if response.get('exceptionDetails'):
+            self.log.debug("CDP promise evaluation raised in page: %s", response['exceptionDetails'].get('text'))
+            return False, None
+        return True, response.get('result', {}).get('value')
+    
     def handle_workflow_error(self, error: Exception, context: str = "") -> None:
         """Handle workflow errors consistently"""
         error_msg = f"{context}: {str(error)}" if context else str(error)
@@ -154,10 +231,12 @@ class BaseWorkflow(ABC):
         self.log.error(error_msg)
     
     def cleanup_resources(self) -> None:
-        """Clean up workflow resources"""
+        """Clean up workflow resources. Safe to call repeatedly; does nothing once the browser is closed."""
+        manager = self.__dict__.get('browser_manager')  # Don't build a manager just to close it
+        if manager is None or manager.is_closed:
+            return
         try:
-            if self.browser_manager:
-                self.browser_manager.cleanup()
+            manager.cleanup()
         except Exception as e:
             self.log.warning(f"Resource cleanup error: {e}")
 
@@ -165,6 +244,8 @@ class BaseWorkflow(ABC):
 class WorkflowResult:
     """Standardized workflow result container"""
     
+    __slots__ = ('success', 'data', 'errors', 'execution_time')  # No per-instance __dict__
+    
     def __init__(self, success: bool = False, data: Dict[str, Any] = None, 
                  errors: list = None, execution_time: float = 0):
         self.success = success
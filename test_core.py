@@ -9,44 +9,79 @@ Run: python test_core.py [test_name] [--verbose]
 All test output is written to debug-log.txt for debugging.
 """
 
+import contextlib
+import importlib
+import os
 import sys
-import json
-import argparse
-import traceback
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+try:
+    import orjson  # Optional: faster selector-file parsing and --json output
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
+# (label, module, public names, may fail without browser dependencies) checked by test_imports
+_IMPORT_CHECKS = [
+    ("config", "core.config", ("SystemConfig", "SiteConfig", "TimeoutConfig"), False),
+    ("structures", "core.structures", ("ExtractedElement", "ElementProperties"), True),
+    ("logger", "utils.logger", ("StealthLogger", "get_logger"), False),
+    ("file_utils", "utils.file_utils", ("ensure_directory_exists", "is_valid_chrome_profile_dir"), True),
+    ("serialization", "utils.serialization", ("CustomJsonEncoder",), True),
+]
 
-class TestResult:
-    """Container for test results"""
-    def __init__(self, name: str):
-        self.name = name
-        self.passed = False
-        self.error = None
-        self.details = {}
+# Project modules used by the concurrently run tests (imported up front by harness.preload_modules)
+_PRELOAD_MODULES = ("core.config", "core.structures", "utils.serialization", "sites", "sites.base_site",
+                    "workflows.base_workflow", "main")
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "name": self.name,
-            "passed": self.passed,
-            "error": str(self.error) if self.error else None,
-            "details": self.details
-        }
+# Site modules every registry should provide, in reporting order
+_EXPECTED_SITES = ('google', 'amazon', 'ebay', 'wikipedia', 'chatgpt', 'generic')
+
+_HERE = Path(__file__).resolve().parent
+_SRC = _HERE / "src"
+_SELECTORS_DIR = _SRC / "sites" / "selectors"
+
+# Add src to path, plus src/utils and src/core for the tests that import those modules directly.
+# Entries already present are not added again (e.g. when pytest imports this module as well).
+sys.path[:0] = [p for p in (str(_SRC), str(_SRC / "utils"), str(_SRC / "core")) if p not in sys.path]
+
+from harness import MAX_WORKERS, TestResult, preload_modules, run_ordered
+
+
+def _parse_selector_file(sf: Path) -> Tuple[str, Dict[str, Any]]:
+    """(file name, validation result) for one selector JSON file"""
+    try:
+        raw = sf.read_bytes()
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(raw)
+        else:
+            import json
+            data = json.loads(raw)
+        return sf.name, {"valid": True, "groups": list(data.keys())}
+    except Exception as e:
+        return sf.name, {"valid": False, "error": str(e)}
 
 
 class CoreTester:
     """Test framework for core components"""
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, report: bool = True):
         self.verbose = verbose
+        self.report = report  # Print banner, failures and summary (off when only JSON output is wanted)
+        self._quiet = not (report or verbose)  # Nobody reads progress logging; skip it entirely
         self.results: List[TestResult] = []
         self.logger = None
+        self._results_lock = threading.Lock()
+        self._passed = 0
+        self._failed_results: List[TestResult] = []  # In the order the failures were reported
 
     def log(self, msg: str, level: str = "info"):
         """Log message to console and debug-log.txt"""
+        if self._quiet:
+            return
         if self.logger:
             getattr(self.logger, level, self.logger.info)(msg)
         if self.verbose or level in ("error", "warning"):
@@ -70,16 +105,19 @@ class CoreTester:
                         print(f"  {k}: {v}")
 
         except Exception as e:
-            result.passed = False
-            result.error = e
-            result.details["traceback"] = traceback.format_exc()
-
-            print(f"FAILED: {name}")
-            print(f"  Error: {e}")
+            if self.report or self.verbose:
+                sys.stdout.write(f"FAILED: {name}\n  Error: {e}\n")
             if self.verbose:
+                import traceback
                 traceback.print_exc()
-
-        self.results.append(result)
+            result.set_error(e)  # Traceback is formatted only if requested (TestResult.to_dict)
+
+        with self._results_lock:
+            self.results.append(result)
+            if result.passed:
+                self._passed += 1
+            else:
+                self._failed_results.append(result)
         return result
 
     # =========================================================================
@@ -91,45 +129,17 @@ class CoreTester:
         imports = {}
         missing_deps = []
 
-        # Config (no browser deps)
-        try:
-            from core.config import SystemConfig, SiteConfig, TimeoutConfig
-            imports["SystemConfig"] = "OK"
-            imports["SiteConfig"] = "OK"
-            imports["TimeoutConfig"] = "OK"
-        except ImportError as e:
-            imports["config"] = f"SKIP: {e}"
-
-        # Structures (may need selenium)
-        try:
-            from core.structures import ExtractedElement, ElementProperties
-            imports["ExtractedElement"] = "OK"
-            imports["ElementProperties"] = "OK"
-        except ImportError as e:
-            missing_deps.append(f"structures: {e}")
-
-        # Logger (no browser deps)
-        try:
-            from utils.logger import StealthLogger, get_logger
-            imports["StealthLogger"] = "OK"
-            imports["get_logger"] = "OK"
-        except ImportError as e:
-            imports["logger"] = f"SKIP: {e}"
-
-        # File utils (no browser deps usually)
-        try:
-            from utils.file_utils import ensure_directory_exists, is_valid_chrome_profile_dir
-            imports["ensure_directory_exists"] = "OK"
-            imports["is_valid_chrome_profile_dir"] = "OK"
-        except ImportError as e:
-            missing_deps.append(f"file_utils: {e}")
-
-        # Serialization (may need selenium)
-        try:
-            from utils.serialization import CustomJsonEncoder
-            imports["CustomJsonEncoder"] = "OK"
-        except ImportError as e:
-            missing_deps.append(f"serialization: {e}")
+        for label, module_name, names, needs_browser_deps in _IMPORT_CHECKS:
+            try:
+                module = importlib.import_module(module_name)
+            except ImportError as e:
+                if needs_browser_deps:
+                    missing_deps.append(f"{label}: {e}")
+                else:
+                    imports[label] = f"SKIP: {e}"
+                continue
+            for name in names:
+                imports[name] = "OK" if hasattr(module, name) else "MISSING"
 
         return {
             "modules_imported": len([v for v in imports.values() if v == "OK"]),
@@ -140,12 +150,15 @@ class CoreTester:
     def test_logger(self) -> Dict[str, Any]:
         """Test logger functionality (direct import without __init__)"""
         # Import directly to avoid dependency chain
-        sys.path.insert(0, str(Path(__file__).parent / "src" / "utils"))
+        import re
+        import logger as logger_module
         from logger import get_logger, StealthLogger
 
         # Create logger
         logger = get_logger(name="test-logger", level="DEBUG")
-        self.logger = logger  # Store for use in other tests
+        if not self._quiet:
+            self.logger = logger  # Store for use in other tests
+        assert get_logger(name="test-logger", level="DEBUG") is logger, "get_logger should reuse the configured logger"
 
         # Test logging levels
         logger.debug("Debug test message")
@@ -153,9 +166,12 @@ class CoreTester:
         logger.warning("Warning test message")
 
         # Test sensitive data filtering
+        sensitive_re = logger_module._SENSITIVE_RE
+        assert isinstance(sensitive_re, re.Pattern), "Sensitive-data pattern should be precompiled"
         filtered = logger._filter_sensitive("password=secret123 token=abc123")
         assert "secret123" not in filtered, "Password not filtered!"
         assert "abc123" not in filtered, "Token not filtered!"
+        assert logger_module._SENSITIVE_RE is sensitive_re, "Sensitive-data pattern should not be rebuilt per call"
 
         # Check debug-log.txt was created
         debug_log = Path("debug-log.txt")
@@ -204,7 +220,6 @@ class CoreTester:
     def test_structures(self) -> Dict[str, Any]:
         """Test data structures (direct import)"""
         # Import directly to avoid dependency chain
-        sys.path.insert(0, str(Path(__file__).parent / "src" / "core"))
         from structures import ExtractedElement, ElementProperties
 
         # Test ElementProperties
@@ -245,15 +260,9 @@ class CoreTester:
             supported = site_registry.list_supported_sites()
 
             # Check expected sites are registered
-            expected_sites = ['google', 'amazon', 'ebay', 'wikipedia', 'chatgpt', 'generic']
-            found_sites = []
-            missing_sites = []
-
-            for site in expected_sites:
-                if site in supported:
-                    found_sites.append(site)
-                else:
-                    missing_sites.append(site)
+            supported_set = frozenset(supported)
+            found_sites = [site for site in _EXPECTED_SITES if site in supported_set]
+            missing_sites = [site for site in _EXPECTED_SITES if site not in supported_set]
 
             return {
                 "supported_sites": supported,
@@ -269,24 +278,12 @@ class CoreTester:
 
     def test_selector_files(self) -> Dict[str, Any]:
         """Test that all selector JSON files are valid"""
-        selectors_dir = Path(__file__).parent / "src" / "sites" / "selectors"
-
-        selector_files = list(selectors_dir.glob("*_selectors.json"))
-        results = {}
-
-        for sf in selector_files:
-            try:
-                with open(sf, 'r') as f:
-                    data = json.load(f)
-                results[sf.name] = {
-                    "valid": True,
-                    "groups": list(data.keys())
-                }
-            except Exception as e:
-                results[sf.name] = {
-                    "valid": False,
-                    "error": str(e)
-                }
+        with os.scandir(_SELECTORS_DIR) as entries:
+            selector_files = [Path(entry.path) for entry in entries
+                              if entry.name.endswith("_selectors.json") and entry.is_file(follow_symlinks=False)]
+        # Reads overlap across files; each file is parsed independently
+        with ThreadPoolExecutor() as pool:
+            results = dict(pool.map(_parse_selector_file, selector_files))
 
         return {
             "total_files": len(selector_files),
@@ -296,18 +293,14 @@ class CoreTester:
     def test_file_utils(self) -> Dict[str, Any]:
         """Test file utility functions (direct import)"""
         # Import directly to avoid dependency chain
-        sys.path.insert(0, str(Path(__file__).parent / "src" / "utils"))
         from file_utils import ensure_directory_exists, is_valid_chrome_profile_dir
         import tempfile
-        import shutil
 
-        # Test directory creation
-        test_dir = Path(tempfile.mkdtemp()) / "test_subdir"
-        result = ensure_directory_exists(test_dir)
-        dir_created = test_dir.exists()
-
-        # Clean up
-        shutil.rmtree(test_dir.parent)
+        # Test directory creation (removed with the temporary directory, even if the check fails)
+        with tempfile.TemporaryDirectory() as tmp:
+            test_dir = Path(tmp) / "test_subdir"
+            ensure_directory_exists(test_dir)
+            dir_created = test_dir.exists()
 
         return {
             "ensure_directory_exists": dir_created,
@@ -316,16 +309,14 @@ class CoreTester:
 
     def test_serialization(self) -> Dict[str, Any]:
         """Test JSON serialization (requires selenium for full test)"""
+        import json
         try:
-            from utils.serialization import CustomJsonEncoder
+            from utils.serialization import CustomJsonEncoder, dumps
+            encoder_kwargs = {"cls": CustomJsonEncoder}
         except ImportError:
             # Test basic Path serialization without selenium
-            class BasicJsonEncoder(json.JSONEncoder):
-                def default(self, obj):
-                    if isinstance(obj, Path):
-                        return str(obj)
-                    return super().default(obj)
-            CustomJsonEncoder = BasicJsonEncoder
+            CustomJsonEncoder = dumps = None
+            encoder_kwargs = {"default": str}
 
         # Test serialization of Path objects
         test_data = {
@@ -334,12 +325,42 @@ class CoreTester:
             "number": 42
         }
 
-        serialized = json.dumps(test_data, cls=CustomJsonEncoder)
+        serialized = json.dumps(test_data, **encoder_kwargs)
         assert "/test/path" in serialized
 
+        # The encoder used for result files (orjson when installed, CustomJsonEncoder otherwise)
+        if dumps is not None:
+            assert b"/test/path" in dumps(test_data), "serialization.dumps should handle Path"
+
+            # Column-wise batches: element i is index i of every column, encoded as dumps() encodes the element
+            from selenium.webdriver.remote.webelement import WebElement
+            from structures import ExtractedElement, ElementProperties  # Direct import, as in test_structures
+            from utils.serialization import serialize_extracted_batch
+
+            class _Driver: # Just enough of a driver for WebElement.tag_name
+                def execute(self, command, params=None):
+                    return {"value": "img"}
+
+            web_element = WebElement(_Driver(), "0123456789abcdef")
+            batch = [
+                ExtractedElement(name="title", value="Awesome Product", extraction_type="text", source_selector="h1",
+                                 properties=ElementProperties(tag_name="h1", text="Awesome Product")),
+                ExtractedElement(name="image", value=web_element, extraction_type="element", source_selector="img",
+                                 properties=ElementProperties(tag_name="img", raw_webelement=web_element)),
+                ExtractedElement(name="saved_to", value=Path("/test/path"), extraction_type="text", source_selector="a"),
+            ]
+            columns = json.loads(serialize_extracted_batch(batch))
+            for i, element in enumerate(batch):
+                rebuilt = {field_name: column[i] for field_name, column in columns.items()}
+                assert rebuilt == json.loads(dumps(element)), f"Batch element {i} does not match its own encoding"
+            assert columns["value"][1].startswith("<WebElement: img"), "WebElement value should be labelled"
+            assert columns["value"][2] == "/test/path", "Path value should be encoded as a string"
+
         return {
-            "CustomJsonEncoder": "OK",
-            "path_serialization": "OK"
+            "CustomJsonEncoder": "OK" if CustomJsonEncoder else "SKIPPED (selenium not installed)",
+            "dumps": ("orjson" if ORJSON_AVAILABLE else "json") if dumps else "SKIPPED (selenium not installed)",
+            "path_serialization": "OK",
+            "batch_serialization": "OK" if dumps else "SKIPPED (selenium not installed)"
         }
 
     def test_parameter_normalization(self) -> Dict[str, Any]:
@@ -469,8 +490,8 @@ class CoreTester:
 
             # Verify site modules are registered
             supported = capabilities['supported_sites']
-            expected_sites = ['google', 'amazon', 'ebay', 'wikipedia', 'chatgpt', 'generic']
-            found = [s for s in expected_sites if s in supported]
+            supported_set = frozenset(supported)
+            found = [s for s in _EXPECTED_SITES if s in supported_set]
 
             return {
                 "system_created": True,
@@ -488,86 +509,191 @@ class CoreTester:
     # Test Runner
     # =========================================================================
 
-    def run_all_tests(self) -> Dict[str, Any]:
-        """Run all tests and return summary"""
-        tests = [
-            ("Import Core Modules", self.test_imports),
-            ("Logger System", self.test_logger),
-            ("Configuration System", self.test_config),
-            ("Data Structures", self.test_structures),
-            ("Site Registry", self.test_site_registry),
-            ("Selector Files", self.test_selector_files),
-            ("File Utilities", self.test_file_utils),
-            ("JSON Serialization", self.test_serialization),
-            ("Parameter Normalization", self.test_parameter_normalization),
-            ("Workflow Result Structure", self.test_workflow_result_structure),
-            ("Site Module Interface", self.test_site_module_interface),
-            ("Main System Instantiation", self.test_main_system_instantiation),
-        ]
-
-        print("\n" + "=" * 70)
-        print("BrowserControL01 - Core Component Tests")
-        print("=" * 70)
-
-        for name, test_func in tests:
+    # (display name, method name), in reporting order
+    TESTS = [
+        ("Import Core Modules", "test_imports"),
+        ("Logger System", "test_logger"),
+        ("Configuration System", "test_config"),
+        ("Data Structures", "test_structures"),
+        ("Site Registry", "test_site_registry"),
+        ("Selector Files", "test_selector_files"),
+        ("File Utilities", "test_file_utils"),
+        ("JSON Serialization", "test_serialization"),
+        ("Parameter Normalization", "test_parameter_normalization"),
+        ("Workflow Result Structure", "test_workflow_result_structure"),
+        ("Site Module Interface", "test_site_module_interface"),
+        ("Main System Instantiation", "test_main_system_instantiation"),
+    ]
+    # Tests that set up shared state (sys.modules, self.logger); run first, on the calling thread
+    SERIAL_TESTS = ("test_imports", "test_logger")
+    def run_all_tests(self, include_tracebacks: bool = False, only: Optional[str] = None,
+                      shard: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+        """Run all tests (or just the method named `only`) and return summary.
+
+        Failure tracebacks are included only if include_tracebacks. With shard=(index, count),
+        only every count-th test starting at index runs (see _run_shards).
+        """
+        selected = [(name, attr) for name, attr in self.TESTS if only is None or attr == only]
+        if shard is not None:
+            index, count = shard
+            selected = selected[index::count]
+        serial = [(name, getattr(self, attr)) for name, attr in selected if attr in self.SERIAL_TESTS]
+        parallel = [(name, getattr(self, attr)) for name, attr in selected if attr not in self.SERIAL_TESTS]
+
+        if self.report:
+            sys.stdout.write(_BANNER)
+
+        # The remaining tests are independent and run concurrently. Verbose output is multi-line
+        # per test, so it stays sequential to remain readable.
+        for name, test_func in serial:
             self.run_test(name, test_func)
+        workers = 1 if self.verbose or not preload_modules(_PRELOAD_MODULES) else MAX_WORKERS
+        # Report in declaration order regardless of completion order
+        self.results[len(serial):] = run_ordered(parallel, self.run_test, workers)
 
         # Summary
-        passed = sum(1 for r in self.results if r.passed)
-        failed = sum(1 for r in self.results if not r.passed)
-
-        print("\n" + "=" * 70)
-        print(f"TEST SUMMARY: {passed} passed, {failed} failed")
-        print("=" * 70)
+        passed = self._passed
+        failed = len(self._failed_results)
 
-        if failed > 0:
-            print("\nFailed tests:")
-            for r in self.results:
-                if not r.passed:
-                    print(f"  - {r.name}: {r.error}")
-
-        print(f"\nDetailed output written to: debug-log.txt")
+        if self.report:
+            sys.stdout.write(_summary_text(passed, failed, [(r.name, r.error) for r in self._failed_results]))
 
         return {
             "total": len(self.results),
             "passed": passed,
             "failed": failed,
-            "results": [r.to_dict() for r in self.results]
+            "results": [r.to_dict(include_tracebacks) for r in self.results]
         }
 
 
-def main():
-    """Main entry point"""
+if "pytest" in sys.modules:
+    # Collected by pytest: the same tests as pytest items (one CoreTester per session, so modules,
+    # sys.path and the logger are set up once; pytest-xdist can spread the items across workers)
+    import pytest
+
+    @pytest.fixture(scope="session")
+    def core_tester() -> "CoreTester":
+        return CoreTester(report=False)
+
+    @pytest.mark.parametrize("attr", [attr for _, attr in CoreTester.TESTS],
+                             ids=[attr[len("test_"):] for _, attr in CoreTester.TESTS])
+    def test_core_component(core_tester: "CoreTester", attr: str):
+        details = getattr(core_tester, attr)() or {}
+        if details.get("status") == "SKIPPED":
+            pytest.skip(details.get("reason", "skipped"))
+
+
+_RULE = "=" * 70
+_BANNER = f"\n{_RULE}\nBrowserControL01 - Core Component Tests\n{_RULE}\n"
+
+
+def _summary_text(passed: int, failed: int, failures: List[Tuple[str, Any]]) -> str:
+    """Summary block printed after a run; failures are (test name, error)"""
+    out = [f"\n{_RULE}", f"TEST SUMMARY: {passed} passed, {failed} failed", _RULE]
+    if failed > 0:
+        out.append("\nFailed tests:")
+        out.extend(f"  - {name}: {error}" for name, error in failures)
+    out.append("\nDetailed output written to: debug-log.txt")
+    return "\n".join(out) + "\n"
+
+
+def _run_shards(count: int) -> Dict[str, Any]:
+    """Run the suite split round-robin across `count` child processes and merge their --json results"""
+    import json
+    import subprocess
+    command = [sys.executable, str(Path(__file__).resolve()), "--json", "--shard-count", str(count)]
+    procs = [subprocess.Popen(command + ["--shard-index", str(i)], stdout=subprocess.PIPE) for i in range(count)]
+
+    results = []
+    for i, proc in enumerate(procs):
+        out, _ = proc.communicate()
+        try:
+            results.extend(json.loads(out)["results"])
+        except ValueError:
+            raise RuntimeError(f"Shard {i} exited with code {proc.returncode} without results")
+
+    order = {name: i for i, (name, _) in enumerate(CoreTester.TESTS)}
+    results.sort(key=lambda r: order[r["name"]])
+    passed = sum(1 for r in results if r["passed"])
+    return {
+        "total": len(results),
+        "passed": passed,
+        "failed": len(results) - passed,
+        "results": results
+    }
+
+
+def _parse_args(argv: List[str]) -> Any:
+    """Command-line options; a plain run (no arguments) gets the defaults without building a parser"""
+    if not argv:
+        from types import SimpleNamespace
+        # Same values as the parser's defaults below
+        return SimpleNamespace(test_name=None, verbose=False, json=False, shards=1, shard_index=None, shard_count=None)
+
+    # Imported here so importing this module (or a plain run) doesn't pay for the CLI machinery
+    import argparse
     parser = argparse.ArgumentParser(
         description="BrowserControL01 Core Component Test Framework",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
   python test_core.py              # Run all tests
+  python test_core.py logger       # Run a single test (test_logger)
   python test_core.py --verbose    # Run with detailed output
   python test_core.py --json       # Output results as JSON
+  python test_core.py --shards 4   # Split the suite across 4 processes
         """
     )
 
+    test_names = [attr[len("test_"):] for _, attr in CoreTester.TESTS]
+    parser.add_argument("test_name", nargs="?", choices=test_names, metavar="test_name",
+                       type=lambda name: name[len("test_"):] if name.startswith("test_") else name,
+                       help=f"Run only this test: {', '.join(test_names)}")
     parser.add_argument("--verbose", "-v", action="store_true",
                        help="Show detailed test output")
     parser.add_argument("--json", "-j", action="store_true",
-                       help="Output results as JSON")
+                       help="Output results as JSON (progress output goes to stderr)")
+    parser.add_argument("--shards", type=int, default=1,
+                       help="Run the suite in this many worker processes (ignored with test_name)")
+    # Set by --shards on its worker processes
+    parser.add_argument("--shard-index", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--shard-count", type=int, help=argparse.SUPPRESS)
 
-    args = parser.parse_args()
+    return parser.parse_args(argv)
 
-    tester = CoreTester(verbose=args.verbose)
+
+def main():
+    """Main entry point"""
+    args = _parse_args(sys.argv[1:])
 
     try:
-        results = tester.run_all_tests()
+        if args.shards > 1 and not args.test_name:
+            if not args.json:
+                sys.stdout.write(_BANNER)
+            results = _run_shards(args.shards)
+            if not args.json:
+                failures = [(r["name"], r["error"]) for r in results["results"] if not r["passed"]]
+                sys.stdout.write(_summary_text(results["passed"], results["failed"], failures))
+        else:
+            tester = CoreTester(verbose=args.verbose, report=not args.json)
+            only = f"test_{args.test_name}" if args.test_name else None
+            shard = (args.shard_index, args.shard_count) if args.shard_count else None
+            # With --json, stdout carries only the JSON document
+            with contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext():
+                results = tester.run_all_tests(include_tracebacks=args.json, only=only, shard=shard)
 
         if args.json:
-            print(json.dumps(results, indent=2))
+            if ORJSON_AVAILABLE:
+                sys.stdout.write(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode("utf-8") + "\n")
+            else:
+                import json
+                print(json.dumps(results, indent=2))
 
         # Exit with error code if any tests failed
         sys.exit(0 if results["failed"] == 0 else 1)
 
     except Exception as e:
+        import traceback
         print(f"\nFATAL ERROR: {e}")
         traceback.print_exc()
         sys.exit(2)
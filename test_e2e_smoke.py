@@ -7,69 +7,135 @@ Validates the complete execution flow without browser dependencies.
 Tests the critical path: config → system → modules → execution flow.
 """
 
+import functools
+import importlib.util
+import os
 import sys
 import json
 from pathlib import Path
+from typing import Any, Dict, Tuple
+try:
+    import orjson  # Optional: faster selector-file parsing
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_SRC = Path(__file__).parent / "src"
+_SELECTORS_DIR = _SRC / "sites" / "selectors"
+_GOOGLE_SELECTORS = _SELECTORS_DIR / "google_selectors.json"
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+sys.path.insert(0, str(_SRC))
 
-# Track which modules are available
-BROWSER_DEPS_AVAILABLE = False
+from harness import TestResult, preload_modules, run_ordered
 
-try:
-    from core.config import SystemConfig, SiteConfig
-    from sites import site_registry
-    from utils.logger import StealthLogger
-    BROWSER_DEPS_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️  Browser dependencies not available: {e}")
+
+def _load_selector_file(path: str) -> dict:
+    """Parse one selector file (a single read; the bytes go straight to the JSON parser)"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+# Track which modules are available. find_spec only locates the packages (nothing is executed);
+# the project modules that need them are imported inside the tests that use them.
+_BROWSER_DEPS = ("selenium", "undetected_chromedriver", "pyautogui", "fake_useragent")
+_MISSING_BROWSER_DEPS = [name for name in _BROWSER_DEPS if importlib.util.find_spec(name) is None]
+BROWSER_DEPS_AVAILABLE = not _MISSING_BROWSER_DEPS
+
+# Project modules imported by the tests (imported up front by harness.preload_modules)
+_PRELOAD_MODULES = ("core.config", "utils.logger", "sites", "sites.base_site", "workflows.base_workflow", "main")
+
+if not BROWSER_DEPS_AVAILABLE:
+    print(f"⚠️  Browser dependencies not available: {', '.join(_MISSING_BROWSER_DEPS)}")
     print("Some tests will be skipped.\n")
 
 
+def requires_browser_deps(test_func):
+    """Decorate a test that needs the browser dependencies; without them it just reports a skip"""
+    if BROWSER_DEPS_AVAILABLE:
+        return test_func  # Decided once, at class creation
+
+    @functools.wraps(test_func)
+    def skipped(self):
+        return {'skipped': True, 'reason': 'Browser dependencies not available'}
+    return skipped
+
+
+def _error_message(record: TestResult) -> str:
+    """Failure text: the assertion message, or the exception type and message for other errors"""
+    error = record.error
+    return str(error) if record.status == 'FAIL' else f"{type(error).__name__}: {error}"
+
+
+def _result_dict(record: TestResult) -> Dict[str, Any]:
+    """Report entry for one test: its status plus the test's return value or the failure text"""
+    if record.passed:
+        return {'name': record.name, 'status': 'PASS', 'result': record.details}
+    return {'name': record.name, 'status': record.status, 'error': _error_message(record)}
+
+
 class SmokeTestRunner:
     """End-to-end smoke test runner"""
 
+    # (display name, method name), in reporting order
+    TESTS = (
+        ("System Configuration Creation", "test_system_config_creation"),
+        ("Site Registry Population", "test_site_registry_populated"),
+        ("Selector Files Exist", "test_selector_files_exist"),
+        ("Selector Files Valid JSON", "test_selector_files_valid_json"),
+        ("Site Config Creation", "test_site_config_creation"),
+        ("Logger Creation", "test_logger_creation"),
+        ("Parameter Normalization", "test_parameter_normalization_logic"),
+        ("Execution Flow Components", "test_execution_flow_components"),
+        ("Workflow Result Structure", "test_workflow_result_structure"),
+    )
+
     def __init__(self):
         self.tests_passed = 0
         self.tests_failed = 0
         self.results = []
+        self._out_buf = []  # Report lines waiting for _flush_output
 
-    def run_test(self, name: str, test_func):
-        """Run a single test"""
+    def _execute(self, name: str, test_func) -> Tuple[TestResult, str]:
+        """Run a single test; returns its result and report line (touches no shared state)"""
+        record = TestResult(name)
         try:
-            result = test_func()
-            self.tests_passed += 1
-            self.results.append({
-                'name': name,
-                'status': 'PASS',
-                'result': result
-            })
-            print(f"✅ {name}")
-            return True
-        except AssertionError as e:
-            self.tests_failed += 1
-            self.results.append({
-                'name': name,
-                'status': 'FAIL',
-                'error': str(e)
-            })
-            print(f"❌ {name}: {e}")
-            return False
+            record.details = test_func()
+            record.passed = True
+            return record, f"✅ {name}"
         except Exception as e:
+            record.set_error(e)
+        marker = "❌" if record.status == 'FAIL' else "💥"
+        return record, f"{marker} {name}: {_error_message(record)}"
+
+    def _record(self, record: TestResult, line: str) -> bool:
+        """Count, store and report one test outcome"""
+        passed = record.passed
+        if passed:
+            self.tests_passed += 1
+        else:
             self.tests_failed += 1
-            self.results.append({
-                'name': name,
-                'status': 'ERROR',
-                'error': f"{type(e).__name__}: {e}"
-            })
-            print(f"💥 {name}: {type(e).__name__}: {e}")
-            return False
+        self.results.append(record)
+        self._out_buf.append(line + "\n")
+        return passed
 
+    def _flush_output(self):
+        """Write buffered report lines in one call"""
+        sys.stdout.write("".join(self._out_buf))
+        sys.stdout.flush()
+        self._out_buf.clear()
+
+    def run_test(self, name: str, test_func):
+        """Run a single test"""
+        passed = self._record(*self._execute(name, test_func))
+        self._flush_output()
+        return passed
+
+    @requires_browser_deps
     def test_system_config_creation(self):
         """Test SystemConfig can be created with defaults"""
-        if not BROWSER_DEPS_AVAILABLE:
-            return {'skipped': True, 'reason': 'Browser dependencies not available'}
+        from core.config import SystemConfig
 
         config = SystemConfig()
         assert config is not None, "Config should not be None"
@@ -77,16 +143,17 @@ class SmokeTestRunner:
         assert hasattr(config, 'log_file'), "Config should have log_file"
         return {'config_created': True, 'base_path': str(config.base_path)}
 
+    @requires_browser_deps
     def test_site_registry_populated(self):
         """Test site registry has all expected modules"""
-        if not BROWSER_DEPS_AVAILABLE:
-            return {'skipped': True, 'reason': 'Browser dependencies not available'}
+        from sites import site_registry
 
         expected_sites = ['google', 'amazon', 'ebay', 'wikipedia', 'chatgpt', 'generic']
         registered = site_registry.list_supported_sites()
 
-        for site in expected_sites:
-            assert site in registered, f"Missing site: {site}"
+        registered_set = frozenset(registered)
+        missing = [site for site in expected_sites if site not in registered_set]
+        assert not missing, f"Missing sites: {missing}"
 
         return {
             'expected': expected_sites,
@@ -96,7 +163,6 @@ class SmokeTestRunner:
 
     def test_selector_files_exist(self):
         """Test all selector files are accessible"""
-        base_path = Path(__file__).parent / "src" / "sites" / "selectors"
         expected_files = [
             'google_selectors.json',
             'amazon_selectors.json',
@@ -106,15 +172,11 @@ class SmokeTestRunner:
             'generic_selectors.json'
         ]
 
-        found = []
-        missing = []
-
-        for filename in expected_files:
-            file_path = base_path / filename
-            if file_path.exists():
-                found.append(filename)
-            else:
-                missing.append(filename)
+        # One directory read instead of a stat per expected file
+        with os.scandir(_SELECTORS_DIR) as entries:
+            present = {entry.name for entry in entries}
+        found = [filename for filename in expected_files if filename in present]
+        missing = [filename for filename in expected_files if filename not in present]
 
         assert len(missing) == 0, f"Missing selector files: {missing}"
 
@@ -126,20 +188,20 @@ class SmokeTestRunner:
 
     def test_selector_files_valid_json(self):
         """Test selector files contain valid JSON"""
-        base_path = Path(__file__).parent / "src" / "sites" / "selectors"
-        selector_files = list(base_path.glob("*_selectors.json"))
+        with os.scandir(_SELECTORS_DIR) as entries:
+            selector_files = [entry for entry in entries
+                              if entry.name.endswith("_selectors.json") and entry.is_file()]
 
         valid = []
         invalid = []
 
-        for file_path in selector_files:
+        for entry in selector_files:
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    assert isinstance(data, dict), f"{file_path.name}: Root should be dict"
-                    valid.append(file_path.name)
+                data = _load_selector_file(entry.path)
+                assert isinstance(data, dict), f"{entry.name}: Root should be dict"
+                valid.append(entry.name)
             except Exception as e:
-                invalid.append(f"{file_path.name}: {e}")
+                invalid.append(f"{entry.name}: {e}")
 
         assert len(invalid) == 0, f"Invalid JSON files: {invalid}"
 
@@ -149,12 +211,12 @@ class SmokeTestRunner:
             'total_checked': len(selector_files)
         }
 
+    @requires_browser_deps
     def test_site_config_creation(self):
         """Test SiteConfig can be created"""
-        if not BROWSER_DEPS_AVAILABLE:
-            return {'skipped': True, 'reason': 'Browser dependencies not available'}
+        from core.config import SiteConfig
 
-        selector_path = Path(__file__).parent / "src" / "sites" / "selectors" / "google_selectors.json"
+        selector_path = _GOOGLE_SELECTORS
 
         config = SiteConfig(
             name="Google",
@@ -173,26 +235,23 @@ class SmokeTestRunner:
             'has_selector_path': config.selector_file_path is not None
         }
 
+    @requires_browser_deps
     def test_logger_creation(self):
         """Test StealthLogger can be created"""
-        if not BROWSER_DEPS_AVAILABLE:
-            return {'skipped': True, 'reason': 'Browser dependencies not available'}
+        from utils.logger import StealthLogger
 
         logger = StealthLogger()
 
         assert logger is not None, "Logger should not be None"
-        assert hasattr(logger, 'debug'), "Logger should have debug method"
-        assert hasattr(logger, 'info'), "Logger should have info method"
-        assert hasattr(logger, 'warning'), "Logger should have warning method"
-        assert hasattr(logger, 'error'), "Logger should have error method"
+        required = frozenset(('debug', 'info', 'warning', 'error'))
+        missing = required.difference(dir(logger))
+        assert not missing, f"Logger is missing methods: {sorted(missing)}"
 
         return {'logger_created': True}
 
+    @requires_browser_deps
     def test_parameter_normalization_logic(self):
         """Test parameter normalization mappings are correct"""
-        if not BROWSER_DEPS_AVAILABLE:
-            return {'skipped': True, 'reason': 'Browser dependencies not available'}
-
         from sites.base_site import BaseSiteModule
 
         aliases = BaseSiteModule.PARAM_ALIASES
@@ -207,11 +266,9 @@ class SmokeTestRunner:
             'total_aliases': len(aliases)
         }
 
+    @requires_browser_deps
     def test_execution_flow_components(self):
         """Test all critical execution flow components exist"""
-        if not BROWSER_DEPS_AVAILABLE:
-            return {'skipped': True, 'reason': 'Browser dependencies not available'}
-
         from main import BrowserControlSystem, load_config
 
         # Test load_config exists and works with None
@@ -232,11 +289,9 @@ class SmokeTestRunner:
             'has_logger': True
         }
 
+    @requires_browser_deps
     def test_workflow_result_structure(self):
         """Test WorkflowResult class works correctly"""
-        if not BROWSER_DEPS_AVAILABLE:
-            return {'skipped': True, 'reason': 'Browser dependencies not available'}
-
         from workflows.base_workflow import WorkflowResult
 
         # Test success result
@@ -268,20 +323,17 @@ class SmokeTestRunner:
         print("=" * 70)
         print()
 
-        tests = [
-            ("System Configuration Creation", self.test_system_config_creation),
-            ("Site Registry Population", self.test_site_registry_populated),
-            ("Selector Files Exist", self.test_selector_files_exist),
-            ("Selector Files Valid JSON", self.test_selector_files_valid_json),
-            ("Site Config Creation", self.test_site_config_creation),
-            ("Logger Creation", self.test_logger_creation),
-            ("Parameter Normalization", self.test_parameter_normalization_logic),
-            ("Execution Flow Components", self.test_execution_flow_components),
-            ("Workflow Result Structure", self.test_workflow_result_structure),
-        ]
+        tests = [(name, getattr(self, attr)) for name, attr in self.TESTS]
 
-        for name, test_func in tests:
-            self.run_test(name, test_func)
+        if preload_modules(_PRELOAD_MODULES):
+            # Independent tests: run them concurrently, then report in order
+            for outcome in run_ordered(tests, self._execute):
+                self._record(*outcome)
+            self._flush_output()
+        else:
+            # Some project module fails to import; keep the run sequential so failures are reproducible
+            for name, test_func in tests:
+                self.run_test(name, test_func)
 
         print()
         print("=" * 70)
@@ -292,7 +344,7 @@ class SmokeTestRunner:
             'total': len(tests),
             'passed': self.tests_passed,
             'failed': self.tests_failed,
-            'results': self.results
+            'results': [_result_dict(r) for r in self.results]
         }
 
 